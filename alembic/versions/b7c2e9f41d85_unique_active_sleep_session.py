@@ -0,0 +1,53 @@
+"""Allow at most one active sleep session per user
+
+Revision ID: b7c2e9f41d85
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c2e9f41d85'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the latest active session per user before enforcing
+    # uniqueness. Older duplicates are deleted rather than closed: closing
+    # them would create fake completed sessions that count in statistics and
+    # exports. Active sessions cannot have a rating or note yet, so only the
+    # abandoned start times are dropped.
+    op.execute(
+        """
+        DELETE FROM sleep_sessions
+        WHERE sleep_end IS NULL
+          AND EXISTS (
+            SELECT 1 FROM sleep_sessions AS newer
+            WHERE newer.user_id = sleep_sessions.user_id
+              AND newer.sleep_end IS NULL
+              AND (
+                newer.sleep_start > sleep_sessions.sleep_start
+                OR (newer.sleep_start = sleep_sessions.sleep_start AND newer.id > sleep_sessions.id)
+              )
+          )
+        """
+    )
+    op.create_index(
+        'uq_sleep_sessions_user_active',
+        'sleep_sessions',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text('sleep_end IS NULL'),
+        sqlite_where=sa.text('sleep_end IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_sleep_sessions_user_active', table_name='sleep_sessions')
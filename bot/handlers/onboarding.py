@@ -1,6 +1,5 @@
 from datetime import time
 
-import pytz
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, ReplyKeyboardRemove
@@ -241,9 +240,7 @@ async def process_timezone_manual(
     """
     timezone_str = message.text.strip()
 
-    try:
-        pytz.timezone(timezone_str)
-    except pytz.exceptions.UnknownTimeZoneError:
+    if not UserService.is_valid_timezone(timezone_str):
         error_msg = loc.get("commands.start.onboarding.invalid_timezone", lang)
         await message.answer(error_msg)
         return
@@ -4,17 +4,18 @@ from io import BytesIO
 from aiogram import Router, F
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, BufferedInputFile
+from aiogram.types import Message, CallbackQuery
 from aiogram_calendar import SimpleCalendar, SimpleCalendarCallback, get_user_locale
 
 from bot.keyboards.inline import get_stats_period_keyboard, get_stats_format_keyboard
 from bot.states.onboarding import StatsStates
-from database import get_session
+from database import async_session_maker, get_session
 from localization import LocalizationService
 from services.sleep_service import SleepService
-from services.statistics_service import StatisticsService
+from services.statistics_service import EXPORT_FIELDNAMES, StatisticsService
 from services.user_service import UserService
 from utils.exporters import CSVExporter, JSONExporter
+from utils.input_file import ChunkedInputFile
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -237,7 +238,7 @@ async def handle_format_selection(
 
     async for session in get_session():
         try:
-            stats_service = StatisticsService(session)
+            stats_service = StatisticsService(session, async_session_maker)
             user_service = UserService(session)
 
             db_user = await user_service.get_user_by_telegram_id(callback.from_user.id)
@@ -247,8 +248,10 @@ async def handle_format_selection(
                 await session.commit()
                 break
 
-            # Get statistics
-            stats = await stats_service.get_statistics(db_user, start_date, end_date)
+            # Get statistics and export data concurrently
+            stats, export_data = await stats_service.get_statistics_with_export_data(
+                db_user, start_date, end_date
+            )
 
             if stats["total_sessions"] == 0:
                 no_data_msg = loc.get("commands.stats.no_data", lang)
@@ -259,9 +262,6 @@ async def handle_format_selection(
                 await session.commit()
                 break
 
-            # Prepare export data
-            export_data = await stats_service.prepare_export_data(db_user, start_date, end_date)
-
             # Generate filename based on period type
             today = datetime.now().strftime("%Y-%m-%d")
             if period_type == "custom" and start_date and end_date:
@@ -274,16 +274,17 @@ async def handle_format_selection(
             else:  # all time
                 filename_base = f"sleep_stats_all_time_{today}"
 
-            # Generate file
+            # Encode the file chunk by chunk while it is being sent
             if format_type == "csv":
-                file_bytes = CSVExporter.export_to_bytes(export_data)
-                filename = f"{filename_base}.csv"
+                file = ChunkedInputFile(
+                    lambda: CSVExporter.iter_chunks(export_data, fieldnames=EXPORT_FIELDNAMES),
+                    filename=f"{filename_base}.csv",
+                )
             else:  # json
-                file_bytes = JSONExporter.export_to_bytes(export_data)
-                filename = f"{filename_base}.json"
-
-            # Send file
-            file = BufferedInputFile(file_bytes, filename=filename)
+                file = ChunkedInputFile(
+                    lambda: JSONExporter.iter_chunks(export_data),
+                    filename=f"{filename_base}.json",
+                )
 
             exported_msg = loc.get(
                 "commands.stats.exported",
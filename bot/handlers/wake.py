@@ -58,17 +58,16 @@ async def cmd_wake(message: Message, lang: str, loc: LocalizationService) -> Non
                 await session.commit()
                 break
 
-            # Format times
-            sleep_time = sleep_service.format_time_for_user(completed_session.sleep_start, db_user)
-            wake_time = sleep_service.format_time_for_user(completed_session.sleep_end, db_user)
-
-            # Format duration
-            hours, minutes = sleep_service.format_duration(completed_session.duration_hours or 0)
+            # Format times, duration and goal progress in one pass
+            [row] = sleep_service.render_sessions(db_user, [completed_session])
+            sleep_time = row["sleep_time"]
+            wake_time = row["wake_time"]
+            hours, minutes = row["hours"], row["minutes"]
 
             # Calculate goal comparison if user has goals
             goal_comparison = ""
             if db_user.target_sleep_hours:
-                percentage = sleep_service.calculate_goal_percentage(db_user, completed_session)
+                percentage = row["goal_percentage"]
                 if percentage is not None:
                     if percentage >= 90:
                         goal_comparison = loc.get(
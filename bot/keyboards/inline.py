@@ -1,3 +1,5 @@
+from functools import cache, lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
@@ -17,9 +19,37 @@ POPULAR_TIMEZONES = [
 ]
 
 
+def _confirm_cancel_markup(
+    confirm_text: str, confirm_data: str, cancel_text: str, cancel_data: str
+) -> InlineKeyboardMarkup:
+    """Build a single-row confirm/cancel keyboard without a builder.
+
+    Args:
+        confirm_text: Confirm button text
+        confirm_data: Callback data for confirm button
+        cancel_text: Cancel button text
+        cancel_data: Callback data for cancel button
+
+    Returns:
+        Keyboard with confirm/cancel buttons
+    """
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(text=confirm_text, callback_data=confirm_data),
+                InlineKeyboardButton(text=cancel_text, callback_data=cancel_data),
+            ]
+        ]
+    )
+
+
+@cache
 def get_language_keyboard() -> InlineKeyboardMarkup:
     """Get language selection keyboard.
 
+    Built once and shared by every caller. The rows are plain lists, so
+    callers must not mutate the returned markup.
+
     Returns:
         Keyboard with language options
     """
@@ -52,8 +82,12 @@ def get_sleep_conflict_keyboard(duration_hours: int, duration_minutes: int) -> I
     return builder.as_markup()
 
 
+@lru_cache(maxsize=16)
 def get_stats_period_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
-    """Get keyboard for statistics period selection.
+    """Get keyboard for statistics period selection (cached per language).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         loc: Localization service
@@ -71,8 +105,12 @@ def get_stats_period_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=16)
 def get_stats_format_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
-    """Get keyboard for export format selection.
+    """Get keyboard for export format selection (cached per language).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         loc: Localization service
@@ -89,8 +127,12 @@ def get_stats_format_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=128)
 def get_confirmation_keyboard(confirm_data: str, cancel_data: str = "cancel") -> InlineKeyboardMarkup:
-    """Get confirmation keyboard.
+    """Get confirmation keyboard (cached per callback data pair).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         confirm_data: Callback data for confirm button
@@ -99,15 +141,15 @@ def get_confirmation_keyboard(confirm_data: str, cancel_data: str = "cancel") ->
     Returns:
         Keyboard with confirm/cancel buttons
     """
-    builder = InlineKeyboardBuilder()
-    builder.button(text="✅ Confirm", callback_data=confirm_data)
-    builder.button(text="❌ Cancel", callback_data=cancel_data)
-    builder.adjust(2)
-    return builder.as_markup()
+    return _confirm_cancel_markup("✅ Confirm", confirm_data, "❌ Cancel", cancel_data)
 
 
+@lru_cache(maxsize=128)
 def get_back_button(callback_data: str = "back") -> InlineKeyboardMarkup:
-    """Get keyboard with back button only.
+    """Get keyboard with back button only (cached per callback data).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         callback_data: Callback data for back button
@@ -120,9 +162,13 @@ def get_back_button(callback_data: str = "back") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_quality_rating_keyboard() -> InlineKeyboardMarkup:
     """Get keyboard for sleep quality rating selection (1-10).
 
+    Built once and shared by every caller. The rows are plain lists, so
+    callers must not mutate the returned markup.
+
     Returns:
         Keyboard with rating buttons 1-10
     """
@@ -137,8 +183,12 @@ def get_quality_rating_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=64)
 def get_quality_confirmation_keyboard(rating: float, loc, lang: str) -> InlineKeyboardMarkup:
-    """Get confirmation keyboard for quality rating update.
+    """Get confirmation keyboard for quality rating update (cached per rating and language).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         rating: Rating value to confirm
@@ -148,17 +198,20 @@ def get_quality_confirmation_keyboard(rating: float, loc, lang: str) -> InlineKe
     Returns:
         Keyboard with confirm/cancel buttons
     """
-    builder = InlineKeyboardBuilder()
-    confirm_text = loc.get("buttons.confirm", lang)
-    cancel_text = loc.get("buttons.cancel", lang)
-    builder.button(text=confirm_text, callback_data=f"quality_confirm_{rating}")
-    builder.button(text=cancel_text, callback_data="quality_cancel")
-    builder.adjust(2)
-    return builder.as_markup()
+    return _confirm_cancel_markup(
+        loc.get("buttons.confirm", lang),
+        f"quality_confirm_{rating}",
+        loc.get("buttons.cancel", lang),
+        "quality_cancel",
+    )
 
 
+@lru_cache(maxsize=16)
 def get_timezone_popular_keyboard(loc: LocalizationService, lang: str) -> InlineKeyboardMarkup:
-    """Get inline keyboard with popular timezone choices.
+    """Get inline keyboard with popular timezone choices (cached per language).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         loc: Localization service
@@ -176,8 +229,12 @@ def get_timezone_popular_keyboard(loc: LocalizationService, lang: str) -> Inline
     return builder.as_markup()
 
 
+@lru_cache(maxsize=16)
 def get_note_confirmation_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
-    """Get confirmation keyboard for note update.
+    """Get confirmation keyboard for note update (cached per language).
+
+    The markup is shared by every caller with the same arguments; callers
+    must not mutate it.
 
     Args:
         loc: Localization service
@@ -186,10 +243,9 @@ def get_note_confirmation_keyboard(loc, lang: str) -> InlineKeyboardMarkup:
     Returns:
         Keyboard with confirm/cancel buttons
     """
-    builder = InlineKeyboardBuilder()
-    confirm_text = loc.get("buttons.confirm", lang)
-    cancel_text = loc.get("buttons.cancel", lang)
-    builder.button(text=confirm_text, callback_data="note_confirm")
-    builder.button(text=cancel_text, callback_data="note_cancel")
-    builder.adjust(2)
-    return builder.as_markup()
+    return _confirm_cancel_markup(
+        loc.get("buttons.confirm", lang),
+        "note_confirm",
+        loc.get("buttons.cancel", lang),
+        "note_cancel",
+    )
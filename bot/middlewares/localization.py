@@ -4,7 +4,7 @@ from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
 
 from database import get_session
-from localization import localization
+from localization import SUPPORTED_LANGUAGES, localization
 from services.user_service import UserService
 from utils.logger import get_logger
 
@@ -48,7 +48,7 @@ class LocalizationMiddleware(BaseMiddleware):
                     lang = db_user.language_code
                 else:
                     # New user - use Telegram's language or default to English
-                    lang = user.language_code if user.language_code in ["en", "ru", "et"] else "en"
+                    lang = user.language_code if user.language_code in SUPPORTED_LANGUAGES else "en"
 
                 data["lang"] = lang
                 data["loc"] = localization
@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     db_name: str = Field(..., description="PostgreSQL database name")
     db_user: str = Field(..., description="PostgreSQL username")
     db_password: str = Field(..., description="PostgreSQL password")
+    db_pool_size: int = Field(default=10, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed under load")
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
 
     # Environment
     environment: str = Field(default="development", description="Environment: development or production")
@@ -12,8 +12,9 @@ engine = create_async_engine(
     settings.database_url,
     echo=False,  # Disable SQL query logging (too verbose)
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,  # Replace connections before server-side idle timeouts
 )
 
 # Create session factory
@@ -1,3 +1,3 @@
-from localization.service import LocalizationService, localization
+from localization.service import SUPPORTED_LANGUAGES, LocalizationService, localization
 
-__all__ = ["LocalizationService", "localization"]
+__all__ = ["SUPPORTED_LANGUAGES", "LocalizationService", "localization"]
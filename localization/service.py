@@ -1,11 +1,58 @@
 import json
 from pathlib import Path
-from typing import Any
+from string import Formatter
+from typing import Any, Final, Iterator, Optional
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Language codes with a translation file in localization/translations
+SUPPORTED_LANGUAGES: Final = ("en", "ru", "et")
+
+
+def _flatten(tree: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Yield (dot-path key, value) pairs for every node of a translation tree.
+
+    Intermediate nodes are included so lookups of a section key behave as
+    they did with nested navigation.
+
+    Args:
+        tree: Nested translation dictionary
+        prefix: Dot-path of ``tree`` itself
+
+    Yields:
+        Tuples of (key, value)
+    """
+    for name, value in tree.items():
+        path = f"{prefix}.{name}" if prefix else name
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, path)
+
+
+def _compile_template(template: str) -> Optional[tuple[tuple[str, Optional[str], str], ...]]:
+    """Pre-parse a translation string into (literal, field, format_spec) segments.
+
+    Args:
+        template: Translation string with ``{name}`` placeholders
+
+    Returns:
+        Segments, or None if the string uses anything beyond plain named
+        fields (conversions, attribute/index access, nested specs) and must
+        go through str.format_map
+    """
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+    segments = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (conversion or not field.isidentifier() or "{" in (spec or "")):
+            return None
+        segments.append((literal, field, spec or ""))
+    return tuple(segments)
+
 
 class LocalizationService:
     """Service for managing multi-language support.
@@ -21,7 +68,11 @@ class LocalizationService:
         """
         self.translations_dir = Path(translations_dir)
         self.translations: dict[str, dict[str, Any]] = {}
-        self.supported_languages = ["en", "ru", "et"]
+        # Dot-path keys ('commands.start.welcome') to values, per language
+        self._flat: dict[str, dict[str, Any]] = {}
+        # Pre-parsed segments of every translation string with placeholders
+        self._templates: dict[str, tuple[tuple[str, Optional[str], str], ...]] = {}
+        self.supported_languages = list(SUPPORTED_LANGUAGES)
         self.default_language = "en"
         self._load_translations()
 
@@ -50,6 +101,12 @@ class LocalizationService:
                     error=str(e),
                 )
                 self.translations[lang_code] = {}
+            self._flat[lang_code] = dict(_flatten(self.translations[lang_code]))
+            for value in self._flat[lang_code].values():
+                if isinstance(value, str) and ("{" in value or "}" in value):
+                    segments = _compile_template(value)
+                    if segments is not None:
+                        self._templates[value] = segments
 
     def get(self, key: str, language: str, **kwargs: Any) -> str:
         """Get localized string by key.
@@ -76,16 +133,7 @@ class LocalizationService:
             )
             language = self.default_language
 
-        # Navigate through nested keys
-        keys = key.split(".")
-        value = self.translations.get(language, {})
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                value = None
-                break
+        value = self._flat.get(language, {}).get(key)
 
         # If translation not found, try default language
         if value is None:
@@ -95,13 +143,7 @@ class LocalizationService:
                 language=language,
                 fallback_to=self.default_language,
             )
-            value = self.translations.get(self.default_language, {})
-            for k in keys:
-                if isinstance(value, dict):
-                    value = value.get(k)
-                else:
-                    value = None
-                    break
+            value = self._flat.get(self.default_language, {}).get(key)
 
         # If still not found, return the key itself
         if value is None:
@@ -111,7 +153,15 @@ class LocalizationService:
         # Format string with provided kwargs
         if isinstance(value, str) and kwargs:
             try:
-                return value.format(**kwargs)
+                segments = self._templates.get(value)
+                if segments is None:
+                    return value.format_map(kwargs)
+                return "".join(
+                    [
+                        literal + format(kwargs[field], spec) if field is not None else literal
+                        for literal, field, spec in segments
+                    ]
+                )
             except KeyError as e:
                 logger.error(
                     "translation_format_error",
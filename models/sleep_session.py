@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import Base, TimestampMixin
@@ -11,6 +11,16 @@ class SleepSession(Base, TimestampMixin):
     """Sleep session model representing a single sleep tracking record."""
 
     __tablename__ = "sleep_sessions"
+    __table_args__ = (
+        # At most one active (not ended) session per user
+        Index(
+            "uq_sleep_sessions_user_active",
+            "user_id",
+            unique=True,
+            postgresql_where=text("sleep_end IS NULL"),
+            sqlite_where=text("sleep_end IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -1,13 +1,82 @@
-from datetime import datetime
-from typing import Optional
-
-from sqlalchemy import and_, desc, func, select
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import (
+    Float,
+    Row,
+    and_,
+    bindparam,
+    delete,
+    desc,
+    exists,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 from models.sleep_session import SleepSession
 from repositories.base import BaseRepository
 
 
+class _hours_between(FunctionElement):
+    """Hours between two timestamps, rounded to 2 decimals, computed in SQL."""
+
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(_hours_between)
+def _compile_hours_between(element: _hours_between, compiler: SQLCompiler, **kw: Any) -> str:
+    # Generic rendering for str(statement) and debug output; real dialects are below
+    return f"hours_between({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(_hours_between, "postgresql")
+def _compile_hours_between_postgresql(
+    element: _hours_between, compiler: SQLCompiler, **kw: Any
+) -> str:
+    start, end = (compiler.process(arg, **kw) for arg in element.clauses)
+    return (
+        f"ROUND(CAST(EXTRACT(EPOCH FROM (CAST({end} AS TIMESTAMP WITH TIME ZONE) - {start}))"
+        " / 3600 AS NUMERIC), 2)"
+    )
+
+
+@compiles(_hours_between, "sqlite")
+def _compile_hours_between_sqlite(element: _hours_between, compiler: SQLCompiler, **kw: Any) -> str:
+    start, end = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"ROUND((julianday({end}) - julianday({start})) * 24, 2)"
+
+
+# Hot read statements are built once at import time; only user_id is bound per call
+_COMPLETED_FOR_USER = and_(
+    SleepSession.user_id == bindparam("user_id"),
+    SleepSession.sleep_end.is_not(None),
+)
+
+_LAST_COMPLETED_STMT = (
+    select(SleepSession)
+    .where(_COMPLETED_FOR_USER)
+    .order_by(desc(SleepSession.sleep_end))
+    .limit(1)
+)
+
+_HAS_COMPLETED_STMT = select(exists().where(_COMPLETED_FOR_USER))
+
+# Empty aggregates come back as 0 instead of NULL
+_STATISTICS_STMT = select(
+    func.count(SleepSession.id),
+    func.coalesce(func.sum(SleepSession.duration_hours), 0),
+    func.coalesce(func.avg(SleepSession.quality_rating), 0),
+).where(_COMPLETED_FOR_USER)
+
+
 class SleepRepository(BaseRepository[SleepSession]):
     """Repository for SleepSession model with sleep-specific operations."""
 
@@ -49,34 +118,36 @@ class SleepRepository(BaseRepository[SleepSession]):
         Returns:
             Last completed sleep session if found, None otherwise
         """
-        result = await self.session.execute(
-            select(SleepSession)
-            .where(
-                and_(
-                    SleepSession.user_id == user_id,
-                    SleepSession.sleep_end.is_not(None),
-                )
-            )
-            .order_by(desc(SleepSession.sleep_end))
-            .limit(1)
-        )
+        result = await self.session.execute(_LAST_COMPLETED_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
 
-    async def start_sleep_session(self, user_id: int, sleep_start: datetime) -> SleepSession:
-        """Start a new sleep session.
+    async def start_sleep_session(
+        self, user_id: int, sleep_start: datetime
+    ) -> Optional[SleepSession]:
+        """Start a new sleep session unless one is already active.
+
+        Relies on the partial unique index on user_id for active sessions,
+        so the check and the insert happen in a single statement.
 
         Args:
             user_id: User ID
             sleep_start: Sleep start time (UTC)
 
         Returns:
-            Created sleep session
+            Created sleep session, or None if the user already has an active one
         """
-        session = await self.create(
-            user_id=user_id,
-            sleep_start=sleep_start,
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        result = await self.session.execute(
+            insert(SleepSession)
+            .values(user_id=user_id, sleep_start=sleep_start)
+            .on_conflict_do_nothing(
+                index_elements=[SleepSession.user_id],
+                index_where=SleepSession.sleep_end.is_(None),
+            )
+            .returning(SleepSession)
         )
-        return session
+        return result.scalar_one_or_none()
 
     async def end_sleep_session(
         self, session: SleepSession, sleep_end: datetime
@@ -93,15 +164,14 @@ class SleepRepository(BaseRepository[SleepSession]):
         duration_hours = session.calculate_duration() if session.sleep_end else None
         if sleep_end:
             # Ensure both datetimes are timezone-aware or both naive for subtraction
-            import pytz
             sleep_start = session.sleep_start
             sleep_end_calc = sleep_end
 
             # Make both timezone-aware for calculation
             if sleep_start.tzinfo is None:
-                sleep_start = sleep_start.replace(tzinfo=pytz.UTC)
+                sleep_start = sleep_start.replace(tzinfo=timezone.utc)
             if sleep_end_calc.tzinfo is None:
-                sleep_end_calc = sleep_end_calc.replace(tzinfo=pytz.UTC)
+                sleep_end_calc = sleep_end_calc.replace(tzinfo=timezone.utc)
 
             delta = sleep_end_calc - sleep_start
             duration_hours = round(delta.total_seconds() / 3600, 2)
@@ -113,6 +183,53 @@ class SleepRepository(BaseRepository[SleepSession]):
         )
         return session
 
+    async def end_active_session(
+        self, user_id: int, sleep_end: datetime
+    ) -> Optional[SleepSession]:
+        """End the user's active sleep session in a single UPDATE ... RETURNING.
+
+        Args:
+            user_id: User ID
+            sleep_end: Sleep end time (UTC)
+
+        Returns:
+            Ended sleep session, or None if the user had no active session
+        """
+        end = literal(sleep_end, SleepSession.sleep_end.type)
+        result = await self.session.execute(
+            update(SleepSession)
+            .where(
+                and_(
+                    SleepSession.user_id == user_id,
+                    SleepSession.sleep_end.is_(None),
+                )
+            )
+            .values(
+                sleep_end=end,
+                duration_hours=_hours_between(SleepSession.sleep_start, end),
+            )
+            .returning(SleepSession)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalars().first()
+
+    async def delete_active_session(self, user_id: int) -> None:
+        """Delete the user's active sleep session, if any, in one statement.
+
+        Args:
+            user_id: User ID
+        """
+        await self.session.execute(
+            delete(SleepSession)
+            .where(
+                and_(
+                    SleepSession.user_id == user_id,
+                    SleepSession.sleep_end.is_(None),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def add_quality_rating(
         self, session: SleepSession, quality_rating: float
     ) -> SleepSession:
@@ -195,6 +312,49 @@ class SleepRepository(BaseRepository[SleepSession]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_export_rows(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[Row]:
+        """Get completed sessions as plain column tuples for export.
+
+        Selects only the exported columns instead of full ORM entities, so no
+        identity-map bookkeeping or instance state is created per row.
+
+        Args:
+            user_id: User ID
+            start_date: Optional start date filter (UTC)
+            end_date: Optional end date filter (UTC)
+
+        Returns:
+            List of (sleep_start, sleep_end, duration_hours, quality_rating, note) rows
+        """
+        query = select(
+            SleepSession.sleep_start,
+            SleepSession.sleep_end,
+            SleepSession.duration_hours,
+            SleepSession.quality_rating,
+            SleepSession.note,
+        ).where(
+            and_(
+                SleepSession.user_id == user_id,
+                SleepSession.sleep_end.is_not(None),
+            )
+        )
+
+        if start_date and end_date:
+            query = query.where(
+                SleepSession.sleep_start >= start_date,
+                SleepSession.sleep_start <= end_date,
+            ).order_by(SleepSession.sleep_start)
+        else:
+            query = query.order_by(desc(SleepSession.sleep_start))
+
+        result = await self.session.execute(query)
+        return list(result.all())
+
     async def get_first_session_date(self, user_id: int) -> Optional[datetime]:
         """Get the date of the first sleep session for a user.
 
@@ -222,37 +382,30 @@ class SleepRepository(BaseRepository[SleepSession]):
         Returns:
             Dictionary with statistics
         """
-        query = select(SleepSession).where(
-            and_(
-                SleepSession.user_id == user_id,
-                SleepSession.sleep_end.is_not(None),
-            )
-        )
-
+        query = _STATISTICS_STMT
         if start_date:
             query = query.where(SleepSession.sleep_start >= start_date)
         if end_date:
             query = query.where(SleepSession.sleep_start <= end_date)
 
-        result = await self.session.execute(query)
-        sessions = list(result.scalars().all())
-
-        if not sessions:
-            return {
-                "total_sessions": 0,
-                "avg_duration": 0,
-                "avg_quality": 0,
-                "total_sleep_hours": 0,
-            }
-
-        total_duration = sum(s.duration_hours or 0 for s in sessions)
-        quality_ratings = [s.quality_rating for s in sessions if s.quality_rating is not None]
+        result = await self.session.execute(query, {"user_id": user_id})
+        total_sessions, total_duration, avg_quality = result.one()
 
         return {
-            "total_sessions": len(sessions),
-            "avg_duration": round(total_duration / len(sessions), 2) if sessions else 0,
-            "avg_quality": round(sum(quality_ratings) / len(quality_ratings), 2)
-            if quality_ratings
-            else 0,
+            "total_sessions": total_sessions,
+            "avg_duration": round(total_duration / total_sessions, 2) if total_sessions else 0,
+            "avg_quality": round(avg_quality, 2),
             "total_sleep_hours": round(total_duration, 2),
         }
+
+    async def has_completed_sessions(self, user_id: int) -> bool:
+        """Check whether user has at least one completed sleep session.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if a completed session exists
+        """
+        result = await self.session.execute(_HAS_COMPLETED_STMT, {"user_id": user_id})
+        return result.scalar_one()
@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-import pytz
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.sleep_session import SleepSession
@@ -13,6 +14,37 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _get_zone(timezone_str: str) -> ZoneInfo:
+    """Resolve a timezone name once and reuse it across calls.
+
+    Args:
+        timezone_str: Timezone string (e.g., 'Europe/Tallinn')
+
+    Returns:
+        Resolved timezone
+    """
+    return ZoneInfo(timezone_str)
+
+
+@lru_cache(maxsize=1024)
+def _format_time_ago_minutes(minutes: int) -> str:
+    """Format whole minutes ago into a human-readable string.
+
+    Args:
+        minutes: Minutes ago
+
+    Returns:
+        Formatted string (e.g., "2 days ago", "5 hours ago")
+    """
+    if minutes < 60:
+        return f"{minutes} minutes ago"
+    elif minutes < 1440:
+        return f"{minutes // 60} hours ago"
+    else:
+        return f"{minutes // 1440} days ago"
+
+
 class SessionUpdateValidation(Enum):
     """Result of session update validation."""
     ALLOW = "allow"  # First update, session is fresh
@@ -42,10 +74,10 @@ class SleepService:
             Datetime in UTC
         """
         try:
-            tz = pytz.timezone(timezone_str)
+            tz = _get_zone(timezone_str)
             if dt.tzinfo is None:
-                dt = tz.localize(dt)
-            return dt.astimezone(pytz.UTC)
+                dt = dt.replace(tzinfo=tz)
+            return dt.astimezone(timezone.utc)
         except Exception as e:
             logger.warning(
                 "timezone_conversion_failed",
@@ -53,7 +85,7 @@ class SleepService:
                 error=str(e),
             )
             # Fallback to UTC
-            return dt.replace(tzinfo=pytz.UTC) if dt.tzinfo is None else dt
+            return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
 
     def _convert_from_utc(self, dt: datetime, timezone_str: str) -> datetime:
         """Convert datetime from UTC to user's timezone.
@@ -66,9 +98,9 @@ class SleepService:
             Datetime in user's timezone
         """
         try:
-            tz = pytz.timezone(timezone_str)
+            tz = _get_zone(timezone_str)
             if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=pytz.UTC)
+                dt = dt.replace(tzinfo=timezone.utc)
             return dt.astimezone(tz)
         except Exception as e:
             logger.warning(
@@ -101,14 +133,11 @@ class SleepService:
         Raises:
             ValueError: If user already has an active session
         """
-        # Check if there's already an active session
-        active_session = await self.get_active_session(user)
-        if active_session:
-            raise ValueError("User already has an active sleep session")
-
         # Create new session with current time in UTC
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
         session = await self.repository.start_sleep_session(user.id, now)
+        if session is None:
+            raise ValueError("User already has an active sleep session")
 
         return session
 
@@ -119,18 +148,16 @@ class SleepService:
             user: User waking up
 
         Returns:
-            Completed sleep session, or None if no active session
+            Completed sleep session
 
         Raises:
             ValueError: If no active session found
         """
-        active_session = await self.get_active_session(user)
-        if not active_session:
-            raise ValueError("No active sleep session found")
-
         # End session with current time in UTC
-        now = datetime.now(pytz.UTC)
-        session = await self.repository.end_sleep_session(active_session, now)
+        now = datetime.now(timezone.utc)
+        session = await self.repository.end_active_session(user.id, now)
+        if session is None:
+            raise ValueError("No active sleep session found")
 
         return session
 
@@ -140,9 +167,7 @@ class SleepService:
         Args:
             user: User whose session to cancel
         """
-        active_session = await self.get_active_session(user)
-        if active_session:
-            await self.repository.delete(active_session)
+        await self.repository.delete_active_session(user.id)
 
     async def get_last_completed_session(self, user: User) -> Optional[SleepSession]:
         """Get user's most recent completed session.
@@ -172,11 +197,11 @@ class SleepService:
             # Should not happen as we check for completed sessions
             return SessionUpdateValidation.SHOW_WARNING, 0.0
 
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
         # Ensure sleep_end is timezone-aware (SQLite returns naive datetimes)
         sleep_end = session.sleep_end
         if sleep_end.tzinfo is None:
-            sleep_end = sleep_end.replace(tzinfo=pytz.UTC)
+            sleep_end = sleep_end.replace(tzinfo=timezone.utc)
         hours_since_wake = (now - sleep_end).total_seconds() / 3600
 
         # Fresh session (< 24 hours)
@@ -251,8 +276,32 @@ class SleepService:
         percentage = int((session.duration_hours / user.target_sleep_hours) * 100)
         return percentage
 
+    def calculate_goal_percentages(
+        self, user: User, sessions: list[SleepSession]
+    ) -> list[Optional[int]]:
+        """Calculate goal percentages for many sessions at once.
+
+        Reads the user's target once instead of per session, which is
+        what list rendering needs.
+
+        Args:
+            user: User with sleep goals
+            sessions: Completed sleep sessions
+
+        Returns:
+            Percentage per session (same order), None where not applicable
+        """
+        target = user.target_sleep_hours
+        if not target:
+            return [None] * len(sessions)
+
+        return [
+            int((session.duration_hours / target) * 100) if session.duration_hours else None
+            for session in sessions
+        ]
+
     def format_duration(self, hours: float) -> tuple[int, int]:
-        """Format duration in hours to (hours, minutes).
+        """Format duration in hours to (hours, minutes), rounded to the nearest minute.
 
         Args:
             hours: Duration in hours
@@ -260,8 +309,7 @@ class SleepService:
         Returns:
             Tuple of (hours, minutes)
         """
-        h = int(hours)
-        m = int((hours - h) * 60)
+        h, m = divmod(round(hours * 60), 60)
         return h, m
 
     def format_time_for_user(self, dt: datetime, user: User) -> str:
@@ -277,6 +325,57 @@ class SleepService:
         user_time = self._convert_from_utc(dt, user.timezone)
         return user_time.strftime("%H:%M")
 
+    def render_sessions(self, user: User, sessions: list[SleepSession]) -> list[dict]:
+        """Prepare display values for a list of completed sessions in one pass.
+
+        Resolves the user's timezone once instead of per session and per
+        helper call; goal percentages come from calculate_goal_percentages.
+
+        Args:
+            user: User with timezone and sleep goals
+            sessions: Completed sleep sessions
+
+        Returns:
+            One dict per session with sleep_time, wake_time (HH:MM in the
+            user's timezone), hours, minutes and goal_percentage (None if the
+            user has no target)
+        """
+        tz: tzinfo
+        try:
+            tz = _get_zone(user.timezone)
+        except Exception as e:
+            logger.warning(
+                "timezone_conversion_failed",
+                timezone=user.timezone,
+                error=str(e),
+            )
+            tz = timezone.utc
+        goal_percentages = self.calculate_goal_percentages(user, sessions)
+
+        rows = []
+        for session, goal_percentage in zip(sessions, goal_percentages):
+            sleep_start = session.sleep_start
+            sleep_end = session.sleep_end
+            if sleep_end is None:
+                # Only completed sessions are rendered
+                continue
+            if sleep_start.tzinfo is None:
+                sleep_start = sleep_start.replace(tzinfo=timezone.utc)
+            if sleep_end.tzinfo is None:
+                sleep_end = sleep_end.replace(tzinfo=timezone.utc)
+
+            hours, minutes = self.format_duration(session.duration_hours or 0)
+            rows.append(
+                {
+                    "sleep_time": sleep_start.astimezone(tz).strftime("%H:%M"),
+                    "wake_time": sleep_end.astimezone(tz).strftime("%H:%M"),
+                    "hours": hours,
+                    "minutes": minutes,
+                    "goal_percentage": goal_percentage,
+                }
+            )
+        return rows
+
     def format_time_ago(self, hours: float) -> str:
         """Format hours ago into human-readable string.
 
@@ -286,15 +385,7 @@ class SleepService:
         Returns:
             Formatted string (e.g., "2 days ago", "5 hours ago")
         """
-        if hours < 1:
-            minutes = int(hours * 60)
-            return f"{minutes} minutes ago"
-        elif hours < 24:
-            h = int(hours)
-            return f"{h} hours ago"
-        else:
-            days = int(hours / 24)
-            return f"{days} days ago"
+        return _format_time_ago_minutes(int(hours * 60))
 
     async def get_sessions_by_date_range(
         self, user: User, start_date: datetime, end_date: datetime
@@ -1,7 +1,8 @@
+import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Final, Optional, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from models.user import User
 from repositories.sleep_repository import SleepRepository
@@ -9,17 +10,36 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
+# Columns of the records built by prepare_export_data, in export order
+EXPORT_FIELDNAMES: Final = (
+    "date",
+    "sleep_start",
+    "sleep_end",
+    "duration_hours",
+    "quality_rating",
+    "note",
+)
+
 
 class StatisticsService:
     """Service for generating sleep statistics and exports."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_maker: Optional[async_sessionmaker[AsyncSession]] = None,
+    ) -> None:
         """Initialize statistics service.
 
         Args:
             session: Async database session
+            session_maker: Optional session factory used to run independent
+                read queries concurrently, each on its own session
         """
         self.repository = SleepRepository(session)
+        self.session_maker = session_maker
 
     async def get_statistics(
         self,
@@ -66,27 +86,24 @@ class StatisticsService:
         Returns:
             List of dictionaries with sleep session data
         """
-        # Get sessions
-        if start_date and end_date:
-            sessions = await self.repository.get_sessions_by_date_range(
-                user.id, start_date, end_date, only_completed=True
-            )
-        else:
-            sessions = await self.repository.get_all_user_sessions(user.id, only_completed=True)
+        rows = await self.repository.get_export_rows(user.id, start_date, end_date)
 
-        # Format data for export
         export_data = []
-        for session in sessions:
-            export_data.append({
-                "date": session.sleep_start.strftime("%Y-%m-%d"),
-                "sleep_start": session.sleep_start.strftime("%Y-%m-%d %H:%M:%S"),
-                "sleep_end": session.sleep_end.strftime("%Y-%m-%d %H:%M:%S")
-                if session.sleep_end
-                else "N/A",
-                "duration_hours": session.duration_hours if session.duration_hours else 0,
-                "quality_rating": session.quality_rating if session.quality_rating else "N/A",
-                "note": session.note if session.note else "N/A",
-            })
+        for sleep_start, sleep_end, duration_hours, quality_rating, note in rows:
+            # isoformat is a C fast path; slicing drops any UTC offset suffix
+            start_str = sleep_start.isoformat(" ", "seconds")[:19]
+            end_str = sleep_end.isoformat(" ", "seconds")[:19] if sleep_end else "N/A"
+
+            export_data.append(
+                {
+                    "date": start_str[:10],
+                    "sleep_start": start_str,
+                    "sleep_end": end_str,
+                    "duration_hours": duration_hours if duration_hours else 0,
+                    "quality_rating": quality_rating if quality_rating else "N/A",
+                    "note": note if note else "N/A",
+                }
+            )
 
         logger.info(
             "export_data_prepared",
@@ -96,8 +113,51 @@ class StatisticsService:
 
         return export_data
 
+    async def get_statistics_with_export_data(
+        self,
+        user: User,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> tuple[dict[str, any], list[dict[str, any]]]:
+        """Get statistics and export data for the same period.
+
+        When a session factory is available both queries run concurrently,
+        each on a dedicated session (an AsyncSession must never be shared
+        between concurrent tasks). Otherwise they run one after another on
+        the service's own session.
+
+        Args:
+            user: User
+            start_date: Optional start date filter (UTC)
+            end_date: Optional end date filter (UTC)
+
+        Returns:
+            Tuple of (statistics dictionary, export data)
+        """
+        maker = self.session_maker
+        if maker is None:
+            stats = await self.get_statistics(user, start_date, end_date)
+            export_data = await self.prepare_export_data(user, start_date, end_date)
+            return stats, export_data
+
+        async def run_in_own_session(
+            method: Callable[
+                ["StatisticsService", User, Optional[datetime], Optional[datetime]],
+                Awaitable[_T],
+            ],
+        ) -> _T:
+            async with maker() as session:
+                return await method(StatisticsService(session), user, start_date, end_date)
+
+        stats, export_data = await asyncio.gather(
+            run_in_own_session(StatisticsService.get_statistics),
+            run_in_own_session(StatisticsService.prepare_export_data),
+        )
+        return stats, export_data
+
+    @staticmethod
     def format_export_message(
-        self, stats: dict[str, any], total_records: int, date_range: Optional[str] = None
+        stats: dict[str, any], total_records: int, date_range: Optional[str] = None
     ) -> str:
         """Format statistics message for export.
 
@@ -133,5 +193,4 @@ class StatisticsService:
         Returns:
             True if user has at least one completed session
         """
-        stats = await self.repository.get_statistics(user.id)
-        return stats["total_sessions"] > 0
+        return await self.repository.has_completed_sessions(user.id)
@@ -1,8 +1,10 @@
 from datetime import time
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from localization import SUPPORTED_LANGUAGES
 from models.user import User
 from repositories.user_repository import UserRepository
 
@@ -44,7 +46,7 @@ class UserService:
             Tuple of (User, is_created)
         """
         # Determine language: use provided or default to 'en'
-        lang = language_code if language_code in ["en", "ru", "et"] else "en"
+        lang = language_code if language_code in SUPPORTED_LANGUAGES else "en"
 
         user, is_created = await self.repository.get_or_create_user(
             telegram_id=telegram_id,
@@ -81,11 +83,29 @@ class UserService:
         Raises:
             ValueError: If language code is not supported
         """
-        if language_code not in ["en", "ru", "et"]:
+        if language_code not in SUPPORTED_LANGUAGES:
             raise ValueError(f"Unsupported language: {language_code}")
 
         return await self.repository.update_language(user, language_code)
 
+    @staticmethod
+    def is_valid_timezone(timezone: str) -> bool:
+        """Check that a string names an IANA timezone.
+
+        Args:
+            timezone: Timezone string (e.g., 'Europe/Tallinn')
+
+        Returns:
+            True if the timezone can be loaded, False otherwise
+        """
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError, OSError):
+            # OSError covers directory names like "Europe" (IsADirectoryError)
+            # and names too long for the filesystem
+            return False
+        return True
+
     async def update_timezone(self, user: User, timezone: str) -> User:
         """Update user's timezone.
 
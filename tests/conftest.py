@@ -1,12 +1,14 @@
 """Shared test fixtures for all test types."""
 
-from datetime import datetime, timedelta
-from typing import AsyncGenerator
+import os
+from collections.abc import Mapping
+from datetime import datetime, time, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, AsyncGenerator
 
 import pytest
-import pytz
-from faker import Faker
-from sqlalchemy import create_engine
+import pytest_asyncio
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -17,132 +19,224 @@ from models.user import User
 from repositories.sleep_repository import SleepRepository
 from repositories.user_repository import UserRepository
 from services.sleep_service import SleepService
+from services.statistics_service import StatisticsService
 from services.user_service import UserService
 
-# Initialize faker for generating test data
-fake = Faker()
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test in the session-wide event loop and mark DB tests slow.
 
-@pytest.fixture
+    Together with ``asyncio_default_fixture_loop_scope = "session"`` this creates
+    one loop for the whole run instead of one per test. Tests that use the
+    database get the ``slow`` marker, which the default ``-m "not slow"``
+    deselects for quick local runs.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    slow = pytest.mark.slow
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if "async_session" in getattr(item, "fixturenames", ()):
+            item.add_marker(slow)
+
+
+# One in-memory database per pytest-xdist worker
+_TEST_DB_NAME = f"testdb_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create an async SQLite in-memory database engine for testing."""
+    """Create an async SQLite in-memory database engine shared by the test session.
+
+    The schema is created once; tests are isolated by the per-test transaction
+    in ``async_session`` instead of re-creating tables.
+    """
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        f"sqlite+aiosqlite:///file:{_TEST_DB_NAME}?mode=memory&cache=shared&uri=true",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=False,
     )
 
+    # aiosqlite's implicit transaction handling breaks SAVEPOINT support,
+    # so disable it and emit BEGIN ourselves.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Test data is throwaway: skip durability work on commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
+    # The in-memory database disappears with its connection; no drop_all needed
     await engine.dispose()
 
 
 @pytest.fixture
 async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create an async database session for testing."""
-    async_session_maker = async_sessionmaker(
-        async_engine, class_=AsyncSession, expire_on_commit=False
-    )
+    """Create an async database session for testing.
+
+    The session is bound to a connection with an outer transaction that is
+    rolled back after the test. ``session.commit()`` inside a test only
+    releases a SAVEPOINT, so no test data leaks into the next test.
+    """
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async with async_session_maker() as session:
         yield session
-        await session.rollback()
+
+        await session.close()
+        await transaction.rollback()
 
 
 @pytest.fixture
-async def user_repository(async_session: AsyncSession) -> UserRepository:
+def session_maker(async_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory on the test's connection.
+
+    Sessions from it join the per-test transaction without savepoints, so
+    they see the test's data and closing them leaves that transaction open.
+    """
+    return async_sessionmaker(
+        bind=async_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="rollback_only",
+    )
+
+
+@pytest.fixture
+def user_repository(async_session: AsyncSession) -> UserRepository:
     """Create a user repository instance."""
     return UserRepository(async_session)
 
 
 @pytest.fixture
-async def sleep_repository(async_session: AsyncSession) -> SleepRepository:
+def sleep_repository(async_session: AsyncSession) -> SleepRepository:
     """Create a sleep repository instance."""
     return SleepRepository(async_session)
 
 
 @pytest.fixture
-async def user_service(async_session: AsyncSession) -> UserService:
+def user_service(async_session: AsyncSession) -> UserService:
     """Create a user service instance."""
     return UserService(async_session)
 
 
 @pytest.fixture
-async def sleep_service(async_session: AsyncSession) -> SleepService:
+def sleep_service(async_session: AsyncSession) -> SleepService:
     """Create a sleep service instance."""
     return SleepService(async_session)
 
 
 @pytest.fixture
-async def test_user(async_session: AsyncSession) -> User:
-    """Create a test user in the database."""
-    user = User(
-        telegram_id=fake.random_int(min=100000, max=999999),
-        username=fake.user_name(),
-        language_code="en",
-        timezone="UTC",
-        target_sleep_hours=8,
-        target_bedtime=datetime.now().replace(hour=22, minute=0, second=0, microsecond=0).time(),
-        target_wake_time=datetime.now().replace(hour=6, minute=0, second=0, microsecond=0).time(),
-    )
-    async_session.add(user)
-    await async_session.commit()
-    await async_session.refresh(user)
-    return user
+def stats_service(async_session: AsyncSession) -> StatisticsService:
+    """Create a statistics service instance."""
+    return StatisticsService(async_session)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _user_template(async_engine) -> Mapping[str, Any]:
+    """Insert the canonical test user once and return its column values.
+
+    The row is committed outside any per-test transaction, so every test
+    sees it; changes a test makes to it are rolled back with that test.
+    """
+    values = {
+        "telegram_id": 100_000_000,
+        "username": "test_user",
+        "language_code": "en",
+        "timezone": "UTC",
+        "target_sleep_hours": 8,
+        "target_bedtime": time(22, 0),
+        "target_wake_time": time(6, 0),
+    }
+    async with async_engine.begin() as conn:
+        result = await conn.execute(insert(User).values(**values).returning(User.id))
+        values["id"] = result.scalar_one()
+    return MappingProxyType(values)
+
+
+@pytest.fixture
+async def test_user(async_session: AsyncSession, _user_template: Mapping[str, Any]) -> User:
+    """Load the shared test user into the per-test session."""
+    return await async_session.merge(User(**_user_template))
 
 
 @pytest.fixture
 async def test_user_with_sessions(async_session: AsyncSession, test_user: User) -> User:
     """Create a test user with multiple sleep sessions."""
-    now = datetime.now(pytz.UTC)
-
-    # Session 1: Old completed session (30 hours ago)
-    old_session = SleepSession(
-        user_id=test_user.id,
-        sleep_start=now - timedelta(hours=38),
-        sleep_end=now - timedelta(hours=30),
-        duration_hours=8.0,
-        quality_rating=7.5,
-        note="Old session note",
+    now = datetime.now(timezone.utc)
+
+    await async_session.execute(
+        insert(SleepSession),
+        [
+            # Session 1: Old completed session (30 hours ago)
+            {
+                "user_id": test_user.id,
+                "sleep_start": now - timedelta(hours=38),
+                "sleep_end": now - timedelta(hours=30),
+                "duration_hours": 8.0,
+                "quality_rating": 7.5,
+                "note": "Old session note",
+            },
+            # Session 2: Recent completed session (2 hours ago)
+            {
+                "user_id": test_user.id,
+                "sleep_start": now - timedelta(hours=10),
+                "sleep_end": now - timedelta(hours=2),
+                "duration_hours": 8.0,
+                "quality_rating": None,
+                "note": None,
+            },
+            # Session 3: Active session (no sleep_end)
+            {
+                "user_id": test_user.id,
+                "sleep_start": now - timedelta(hours=1),
+                "sleep_end": None,
+                "duration_hours": None,
+                "quality_rating": None,
+                "note": None,
+            },
+        ],
     )
-    async_session.add(old_session)
+    await async_session.commit()
+    return test_user
 
-    # Session 2: Recent completed session (2 hours ago)
-    recent_session = SleepSession(
-        user_id=test_user.id,
-        sleep_start=now - timedelta(hours=10),
-        sleep_end=now - timedelta(hours=2),
-        duration_hours=8.0,
-        quality_rating=None,
-        note=None,
-    )
-    async_session.add(recent_session)
 
-    # Session 3: Active session (no sleep_end)
-    active_session = SleepSession(
+@pytest.fixture
+async def active_session(async_session: AsyncSession, test_user: User) -> SleepSession:
+    """Create an active (not ended) session started an hour ago."""
+    now = datetime.now(timezone.utc)
+    session = SleepSession(
         user_id=test_user.id,
         sleep_start=now - timedelta(hours=1),
         sleep_end=None,
         duration_hours=None,
     )
-    async_session.add(active_session)
-
+    async_session.add(session)
     await async_session.commit()
-    await async_session.refresh(test_user)
-    return test_user
+    return session
 
 
 @pytest.fixture
 async def completed_session_old(async_session: AsyncSession, test_user: User) -> SleepSession:
     """Create a completed session older than 24 hours."""
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     session = SleepSession(
         user_id=test_user.id,
         sleep_start=now - timedelta(hours=32),
@@ -153,14 +247,13 @@ async def completed_session_old(async_session: AsyncSession, test_user: User) ->
     )
     async_session.add(session)
     await async_session.commit()
-    await async_session.refresh(session)
     return session
 
 
 @pytest.fixture
 async def completed_session_recent(async_session: AsyncSession, test_user: User) -> SleepSession:
     """Create a recently completed session (< 24 hours)."""
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     session = SleepSession(
         user_id=test_user.id,
         sleep_start=now - timedelta(hours=10),
@@ -171,7 +264,6 @@ async def completed_session_recent(async_session: AsyncSession, test_user: User)
     )
     async_session.add(session)
     await async_session.commit()
-    await async_session.refresh(session)
     return session
 
 
@@ -180,7 +272,7 @@ async def completed_session_with_rating(
     async_session: AsyncSession, test_user: User
 ) -> SleepSession:
     """Create a completed session with existing quality rating."""
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     session = SleepSession(
         user_id=test_user.id,
         sleep_start=now - timedelta(hours=10),
@@ -191,7 +283,6 @@ async def completed_session_with_rating(
     )
     async_session.add(session)
     await async_session.commit()
-    await async_session.refresh(session)
     return session
 
 
@@ -200,7 +291,7 @@ async def completed_session_with_note(
     async_session: AsyncSession, test_user: User
 ) -> SleepSession:
     """Create a completed session with existing note."""
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     session = SleepSession(
         user_id=test_user.id,
         sleep_start=now - timedelta(hours=10),
@@ -211,20 +302,25 @@ async def completed_session_with_note(
     )
     async_session.add(session)
     await async_session.commit()
-    await async_session.refresh(session)
     return session
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def localization_service() -> LocalizationService:
-    """Create a localization service instance."""
+    """Create a localization service instance shared by the test session.
+
+    Translations are loaded from disk once; tests only read from the service.
+    """
     return LocalizationService()
 
 
-@pytest.fixture
-def malicious_sql_payloads() -> list[str]:
-    """Common SQL injection attack payloads for testing."""
-    return [
+@pytest.fixture(scope="session")
+def malicious_sql_payloads() -> tuple[str, ...]:
+    """Common SQL injection attack payloads for testing.
+
+    Session-scoped and immutable so the same payloads are shared by every test.
+    """
+    return (
         "'; DROP TABLE users; --",
         "1' OR '1'='1",
         "admin'--",
@@ -235,4 +331,4 @@ def malicious_sql_payloads() -> list[str]:
         "1' AND '1'='1",
         "<script>alert('XSS')</script>",
         "'; EXEC xp_cmdshell('dir'); --",
-    ]
+    )
@@ -58,15 +58,12 @@ class TestCSVExporter:
 
         result = CSVExporter.export(data)
 
-        # Parse CSV to verify structure
-        csv_file = StringIO(result)
-        reader = csv.DictReader(csv_file)
-        rows = list(reader)
-
-        assert len(rows) == 2
-        assert rows[0]["date"] == "2026-01-13"
-        assert rows[0]["duration_hours"] == "8.0"
-        assert rows[1]["date"] == "2026-01-14"
+        lines = result.splitlines()
+        assert lines == [
+            "date,duration_hours,quality_rating",
+            "2026-01-13,8.0,8.5",
+            "2026-01-14,7.5,7.0",
+        ]
 
     def test_export_with_special_characters(self):
         """Test exporting data with special characters in notes."""
@@ -83,19 +80,95 @@ class TestCSVExporter:
         # CSV should properly escape quotes
         assert "great" in result
 
+    def test_export_matches_csv_module(self):
+        """Test that plain and quoted rows produce the same output as csv.DictWriter."""
+        for data in (
+            [{"date": "2026-01-13", "duration_hours": 7.5, "note": None}],
+            [{"date": "2026-01-13", "note": 'Had "great" sleep,\nfelt amazing!'}],
+            [{"date": "2026-01-13", "note": "a"}, {"date": "2026-01-14"}],
+            [{"note": ""}],
+        ):
+            expected = StringIO()
+            writer = csv.DictWriter(expected, fieldnames=data[0].keys())
+            writer.writeheader()
+            writer.writerows(data)
+
+            assert CSVExporter.export(data) == expected.getvalue()
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [{"note": 'a "b"'}, {"note": "c"}],
+            [
+                {"date": "2026-01-13", "note": 'a, "b"'},
+                {"date": "2026-01-14"},
+            ],
+            [
+                {"date": "2026-01-13", "note": "a,b"},
+                {"date": "2026-01-14", "note": "c", "extra": 1},
+            ],
+        ],
+    )
+    def test_export_uneven_rows_matches_dict_writer(self, data):
+        """Test single-column data and rows with missing or extra keys."""
+        expected = StringIO()
+        writer = csv.DictWriter(expected, fieldnames=data[0].keys(), extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(data)
+
+        assert CSVExporter.export(data) == expected.getvalue()
+
+    def test_export_to_bytes_matches_export_when_quoting(self):
+        """Test that bytes written through the csv module match the encoded string."""
+        data = [
+            {"date": "2026-01-13", "note": 'Сон "отличный", 😴'},
+            {"date": "2026-01-14", "note": "line\nbreak"},
+        ]
+
+        assert CSVExporter.export_to_bytes(data) == CSVExporter.export(data).encode("utf-8")
+
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 500])
+    def test_iter_chunks_matches_csv_module(self, chunk_rows):
+        """Test that joined chunks, plain and quoted alike, match csv.DictWriter."""
+        data = [
+            {"date": "2026-01-13", "note": 'Сон "отличный", 😴'},
+            {"date": "2026-01-14", "note": None},
+            {"date": "2026-01-15", "note": "line\nbreak"},
+        ]
+        expected = StringIO()
+        writer = csv.DictWriter(expected, fieldnames=data[0].keys())
+        writer.writeheader()
+        writer.writerows(data)
+
+        chunks = list(CSVExporter.iter_chunks(data, chunk_rows=chunk_rows))
+
+        assert len(chunks) == -(-len(data) // chunk_rows)
+        assert b"".join(chunks) == expected.getvalue().encode("utf-8")
+        assert b"".join(chunks) == CSVExporter.export_to_bytes(data)
+
+    def test_iter_chunks_empty(self):
+        """Test that empty data without field names yields no chunks."""
+        assert list(CSVExporter.iter_chunks([])) == []
+
+    def test_iter_chunks_empty_with_fieldnames(self):
+        """Test that the header is written even when there is no data."""
+        chunks = list(CSVExporter.iter_chunks([], fieldnames=["date", "note"]))
+
+        assert chunks == [b"date,note\r\n"]
+
     def test_export_with_unicode(self):
         """Test exporting data with unicode characters."""
         data = [
             {
                 "date": "2026-01-13",
-                "note": "Отличный сон 😴",
+                "note": "Отличный сон 😴 中文",
             }
         ]
 
         result = CSVExporter.export(data)
 
-        assert result != ""
-        assert "Отличный сон" in result
+        assert result == "date,note\r\n2026-01-13,Отличный сон 😴 中文\r\n"
+        assert CSVExporter.export_to_bytes(data) == result.encode("utf-8")
 
     def test_export_to_bytes_empty(self):
         """Test converting empty CSV to bytes."""
@@ -212,12 +285,29 @@ class TestJSONExporter:
         result_2 = JSONExporter.export(data, indent=2)
         result_4 = JSONExporter.export(data, indent=4)
 
-        # Both should be valid JSON
+        # Both should be valid JSON; orjson always indents by 2 spaces
         json.loads(result_2)
         json.loads(result_4)
+        assert result_2 == '[\n  {\n    "date": "2026-01-13"\n  }\n]'
+        assert result_4 == result_2
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 500])
+    def test_iter_chunks_matches_export_to_bytes(self, indent, chunk_rows):
+        """Test that joined chunks equal the single-buffer export."""
+        data = [
+            {"date": "2026-01-13", "duration_hours": 8.0, "note": "Отличный сон 😴"},
+            {"date": "2026-01-14", "duration_hours": 7.5, "note": None},
+            {"date": "2026-01-15", "duration_hours": 6.0, "note": "ok"},
+        ]
+
+        joined = b"".join(JSONExporter.iter_chunks(data, indent=indent, chunk_rows=chunk_rows))
+
+        assert joined == JSONExporter.export_to_bytes(data, indent=indent)
 
-        # Different indentation should produce different lengths
-        assert len(result_2) != len(result_4)
+    def test_iter_chunks_empty(self):
+        """Test that empty data yields an empty JSON array."""
+        assert b"".join(JSONExporter.iter_chunks([])) == b"[]"
 
     def test_export_to_bytes_empty(self):
         """Test converting empty JSON to bytes."""
@@ -254,14 +344,7 @@ class TestJSONExporter:
             }
         ]
 
-        result = JSONExporter.export(data)
-
-        parsed = json.loads(result)
-        assert parsed[0]["string"] == "text"
-        assert parsed[0]["integer"] == 42
-        assert parsed[0]["float"] == 3.14
-        assert parsed[0]["boolean"] is True
-        assert parsed[0]["null"] is None
+        assert json.loads(JSONExporter.export(data)) == data
 
     def test_export_preserves_dict_structure(self):
         """Test that nested structures are preserved (if any)."""
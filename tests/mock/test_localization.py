@@ -90,43 +90,25 @@ class TestLocalizationService:
         assert isinstance(result, str)
         assert result != ""
 
-    def test_get_language_name_english(self, localization_service: LocalizationService):
-        """Test getting language name in English."""
-        name = localization_service.get_language_name("en")
-        assert name == "English"
-
-    def test_get_language_name_russian(self, localization_service: LocalizationService):
-        """Test getting language name in Russian."""
-        name = localization_service.get_language_name("ru")
-        assert name == "Русский"
-
-    def test_get_language_name_estonian(self, localization_service: LocalizationService):
-        """Test getting language name in Estonian."""
-        name = localization_service.get_language_name("et")
-        assert name == "Eesti"
-
-    def test_get_language_name_unsupported(self, localization_service: LocalizationService):
-        """Test getting language name for unsupported language."""
-        name = localization_service.get_language_name("fr")
-        assert name == "fr"  # Should return the code itself
-
-    def test_is_supported_english(self, localization_service: LocalizationService):
-        """Test that English is supported."""
-        assert localization_service.is_supported("en") is True
-
-    def test_is_supported_russian(self, localization_service: LocalizationService):
-        """Test that Russian is supported."""
-        assert localization_service.is_supported("ru") is True
-
-    def test_is_supported_estonian(self, localization_service: LocalizationService):
-        """Test that Estonian is supported."""
-        assert localization_service.is_supported("et") is True
-
-    def test_is_supported_unsupported_language(self, localization_service: LocalizationService):
-        """Test that unsupported language returns False."""
-        assert localization_service.is_supported("fr") is False
-        assert localization_service.is_supported("de") is False
-        assert localization_service.is_supported("es") is False
+    @pytest.mark.parametrize(
+        "code, name",
+        [("en", "English"), ("ru", "Русский"), ("et", "Eesti"), ("fr", "fr")],
+    )
+    def test_get_language_name(
+        self, localization_service: LocalizationService, code: str, name: str
+    ):
+        """Test language names; unsupported codes return the code itself."""
+        assert localization_service.get_language_name(code) == name
+
+    @pytest.mark.parametrize(
+        "code, supported",
+        [("en", True), ("ru", True), ("et", True), ("fr", False), ("de", False), ("es", False)],
+    )
+    def test_is_supported(
+        self, localization_service: LocalizationService, code: str, supported: bool
+    ):
+        """Test supported language detection."""
+        assert localization_service.is_supported(code) is supported
 
     def test_all_supported_languages_have_translations(
         self, localization_service: LocalizationService
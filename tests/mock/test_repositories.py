@@ -1,15 +1,18 @@
 """Mock tests for repository layer."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
 
 import pytest
-import pytz
+from sqlalchemy.dialects import postgresql
 
 from models.sleep_session import SleepSession
 from models.user import User
 from repositories.sleep_repository import SleepRepository
 from repositories.user_repository import UserRepository
 
+UTC = timezone.utc
+
 
 class TestUserRepository:
     """Test user repository operations."""
@@ -77,7 +80,7 @@ class TestSleepRepository:
         self, sleep_repository: SleepRepository, test_user: User
     ):
         """Test creating a new sleep session."""
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
         session = await sleep_repository.start_sleep_session(test_user.id, now)
 
         assert session.id is not None
@@ -86,12 +89,26 @@ class TestSleepRepository:
         assert session.sleep_start.replace(tzinfo=None) == now.replace(tzinfo=None)
         assert session.sleep_end is None
 
+    @pytest.mark.asyncio
+    async def test_start_sleep_session_already_active(
+        self, sleep_repository: SleepRepository, test_user: User
+    ):
+        """Test that a second active session is not created."""
+        now = datetime.now(UTC)
+        first = await sleep_repository.start_sleep_session(test_user.id, now - timedelta(hours=1))
+        second = await sleep_repository.start_sleep_session(test_user.id, now)
+
+        assert first is not None
+        assert second is None
+        active_session = await sleep_repository.get_active_session(test_user.id)
+        assert active_session.id == first.id
+
     @pytest.mark.asyncio
     async def test_get_active_session(
         self, sleep_repository: SleepRepository, test_user: User, async_session
     ):
         """Test retrieving active sleep session."""
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
         active_session = SleepSession(
             user_id=test_user.id,
             sleep_start=now,
@@ -119,7 +136,7 @@ class TestSleepRepository:
         self, sleep_repository: SleepRepository, test_user: User, async_session
     ):
         """Test ending an active sleep session."""
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
         start_time = now - timedelta(hours=8)
 
         active_session = SleepSession(
@@ -137,6 +154,64 @@ class TestSleepRepository:
         assert ended_session.sleep_end.replace(tzinfo=None) == now.replace(tzinfo=None)
         assert ended_session.duration_hours == pytest.approx(8.0, rel=0.01)
 
+    @pytest.mark.asyncio
+    async def test_end_active_session(
+        self, sleep_repository: SleepRepository, test_user: User, async_session
+    ):
+        """Test ending the active session with a single UPDATE ... RETURNING."""
+        now = datetime.now(UTC)
+        active_session = SleepSession(
+            user_id=test_user.id,
+            sleep_start=now - timedelta(hours=7, minutes=30),
+            sleep_end=None,
+        )
+        async_session.add(active_session)
+        await async_session.commit()
+
+        ended_session = await sleep_repository.end_active_session(test_user.id, now)
+
+        assert ended_session is not None
+        assert ended_session.id == active_session.id
+        assert ended_session.sleep_end.replace(tzinfo=None) == now.replace(tzinfo=None)
+        assert ended_session.duration_hours == pytest.approx(7.5, abs=0.01)
+        assert await sleep_repository.get_active_session(test_user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_end_active_session_none(
+        self, sleep_repository: SleepRepository, test_user: User
+    ):
+        """Test that ending without an active session returns None."""
+        now = datetime.now(UTC)
+        assert await sleep_repository.end_active_session(test_user.id, now) is None
+
+    @pytest.mark.asyncio
+    async def test_end_active_session_postgresql_duration(self):
+        """Test the duration expression emitted for PostgreSQL (tests run on SQLite)."""
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock())
+        await SleepRepository(session).end_active_session(1, datetime.now(UTC))
+
+        statement = session.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert (
+            "duration_hours=ROUND(CAST(EXTRACT(EPOCH FROM (CAST(%(sleep_end)s AS TIMESTAMP "
+            "WITH TIME ZONE) - sleep_sessions.sleep_start)) / 3600 AS NUMERIC), 2)"
+        ) in sql
+
+    @pytest.mark.asyncio
+    async def test_delete_active_session(
+        self, sleep_repository: SleepRepository, test_user_with_sessions: User
+    ):
+        """Test that only the active session is deleted."""
+        await sleep_repository.delete_active_session(test_user_with_sessions.id)
+
+        assert await sleep_repository.get_active_session(test_user_with_sessions.id) is None
+        completed = await sleep_repository.get_all_user_sessions(
+            test_user_with_sessions.id, only_completed=True
+        )
+        assert len(completed) == 2
+
     @pytest.mark.asyncio
     async def test_get_last_completed_session(
         self, sleep_repository: SleepRepository, test_user_with_sessions: User
@@ -178,29 +253,29 @@ class TestSleepRepository:
         self, sleep_repository: SleepRepository, test_user: User, async_session
     ):
         """Test retrieving sessions within a date range."""
-        now = datetime.now(pytz.UTC)
-
-        # Create sessions at different times
-        for i in range(5):
-            session = SleepSession(
-                user_id=test_user.id,
-                sleep_start=now - timedelta(days=i + 1, hours=8),
-                sleep_end=now - timedelta(days=i + 1),
-                duration_hours=8.0,
-            )
-            async_session.add(session)
+        end_date = datetime(2026, 1, 15, 8, 0, tzinfo=UTC)
+        start_date = end_date - timedelta(days=3)
+
+        # Two sessions inside the range, one before it
+        async_session.add_all(
+            [
+                SleepSession(
+                    user_id=test_user.id,
+                    sleep_start=end_date - timedelta(days=days, hours=8),
+                    sleep_end=end_date - timedelta(days=days),
+                    duration_hours=8.0,
+                )
+                for days in (1, 2, 5)
+            ]
+        )
         await async_session.commit()
 
-        # Get sessions from last 3 days
-        start_date = now - timedelta(days=3)
-        end_date = now
-
         sessions = await sleep_repository.get_sessions_by_date_range(
             test_user.id, start_date, end_date, only_completed=True
         )
 
-        # Should return sessions from days 1, 2, 3 (3 sessions)
-        assert len(sessions) >= 2  # At least the most recent ones
+        assert len(sessions) == 2
+        assert sessions[0].sleep_start < sessions[1].sleep_start
 
     @pytest.mark.asyncio
     async def test_get_all_user_sessions(
@@ -215,6 +290,50 @@ class TestSleepRepository:
         assert all(session.sleep_end is not None for session in sessions)
         assert len(sessions) >= 2
 
+    @pytest.mark.asyncio
+    async def test_get_export_rows(
+        self, sleep_repository: SleepRepository, test_user_with_sessions: User
+    ):
+        """Test that export rows are plain tuples of completed sessions only."""
+        rows = await sleep_repository.get_export_rows(test_user_with_sessions.id)
+
+        assert len(rows) == 2
+        # Most recent first when no date range is given
+        assert rows[0].sleep_start > rows[1].sleep_start
+        sleep_start, sleep_end, duration_hours, quality_rating, note = rows[1]
+        assert sleep_end is not None
+        assert duration_hours == 8.0
+        assert quality_rating == 7.5
+        assert note == "Old session note"
+
+    @pytest.mark.asyncio
+    async def test_get_statistics(
+        self, sleep_repository: SleepRepository, test_user_with_sessions: User
+    ):
+        """Test that statistics are aggregated over completed sessions only."""
+        stats = await sleep_repository.get_statistics(test_user_with_sessions.id)
+
+        assert stats == {
+            "total_sessions": 2,
+            "avg_duration": 8.0,
+            "avg_quality": 7.5,  # Unrated sessions are ignored
+            "total_sleep_hours": 16.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_has_completed_sessions(
+        self, sleep_repository: SleepRepository, test_user_with_sessions: User
+    ):
+        """Test completed session existence check."""
+        assert await sleep_repository.has_completed_sessions(test_user_with_sessions.id) is True
+
+    @pytest.mark.asyncio
+    async def test_has_completed_sessions_none(
+        self, sleep_repository: SleepRepository, test_user: User
+    ):
+        """Test that existence check is False for a user without sessions."""
+        assert await sleep_repository.has_completed_sessions(test_user.id) is False
+
     @pytest.mark.asyncio
     async def test_delete_session(
         self, sleep_repository: SleepRepository, completed_session_recent: SleepSession
@@ -254,7 +373,7 @@ class TestRepositoryConcurrency:
         self, sleep_repository: SleepRepository, test_user: User, async_session
     ):
         """Test creating multiple sessions for the same user."""
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
 
         # Create and complete first session
         session1 = await sleep_repository.start_sleep_session(
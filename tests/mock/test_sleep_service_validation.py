@@ -1,9 +1,7 @@
 """Mock tests for sleep service validation logic with time windows."""
 
-from datetime import datetime, timedelta
-
 import pytest
-import pytz
+from sqlalchemy import select
 
 from models.sleep_session import SleepSession
 from models.user import User
@@ -13,8 +11,7 @@ from services.sleep_service import SessionUpdateValidation, SleepService
 class TestSleepServiceValidation:
     """Test sleep service validation methods."""
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_allow_first_rating(
+    def test_validate_session_update_allow_first_rating(
         self, sleep_service: SleepService, completed_session_recent: SleepSession
     ):
         """Test that first rating on fresh session is allowed without confirmation."""
@@ -25,8 +22,7 @@ class TestSleepServiceValidation:
         assert validation == SessionUpdateValidation.ALLOW
         assert hours_since_wake < 24
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_allow_first_note(
+    def test_validate_session_update_allow_first_note(
         self, sleep_service: SleepService, completed_session_recent: SleepSession
     ):
         """Test that first note on fresh session is allowed without confirmation."""
@@ -37,8 +33,7 @@ class TestSleepServiceValidation:
         assert validation == SessionUpdateValidation.ALLOW
         assert hours_since_wake < 24
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_ask_confirmation_fresh_with_rating(
+    def test_validate_session_update_ask_confirmation_fresh_with_rating(
         self, sleep_service: SleepService, completed_session_with_rating: SleepSession
     ):
         """Test that updating rating on fresh session asks for confirmation."""
@@ -49,8 +44,7 @@ class TestSleepServiceValidation:
         assert validation == SessionUpdateValidation.ASK_CONFIRMATION
         assert hours_since_wake < 24
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_ask_confirmation_fresh_with_note(
+    def test_validate_session_update_ask_confirmation_fresh_with_note(
         self, sleep_service: SleepService, completed_session_with_note: SleepSession
     ):
         """Test that updating note on fresh session asks for confirmation."""
@@ -61,8 +55,7 @@ class TestSleepServiceValidation:
         assert validation == SessionUpdateValidation.ASK_CONFIRMATION
         assert hours_since_wake < 24
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_show_warning_old_session(
+    def test_validate_session_update_show_warning_old_session(
         self, sleep_service: SleepService, completed_session_old: SleepSession
     ):
         """Test that old session (>= 24h) shows warning regardless of existing data."""
@@ -74,8 +67,7 @@ class TestSleepServiceValidation:
         assert validation == SessionUpdateValidation.SHOW_WARNING
         assert hours_since_wake >= 24
 
-    @pytest.mark.asyncio
-    async def test_validate_session_update_show_warning_old_session_with_data(
+    def test_validate_session_update_show_warning_old_session_with_data(
         self, sleep_service: SleepService, completed_session_old: SleepSession
     ):
         """Test that old session shows warning even with existing data."""
@@ -96,37 +88,19 @@ class TestSleepServiceValidation:
             assert session.quality_rating == rating
 
     @pytest.mark.asyncio
-    async def test_add_quality_rating_invalid_range_low(
-        self, sleep_service: SleepService, completed_session_recent: SleepSession
-    ):
-        """Test that rating below 1.0 raises ValueError."""
-        with pytest.raises(ValueError, match="Quality rating must be between 1.0 and 10.0"):
-            await sleep_service.add_quality_rating(completed_session_recent, 0.5)
-
-    @pytest.mark.asyncio
-    async def test_add_quality_rating_invalid_range_high(
-        self, sleep_service: SleepService, completed_session_recent: SleepSession
+    @pytest.mark.parametrize("rating", [0.5, 10.5])
+    async def test_add_quality_rating_invalid_range(
+        self, sleep_service: SleepService, completed_session_recent: SleepSession, rating: float
     ):
-        """Test that rating above 10.0 raises ValueError."""
+        """Test that ratings outside 1.0-10.0 raise ValueError."""
         with pytest.raises(ValueError, match="Quality rating must be between 1.0 and 10.0"):
-            await sleep_service.add_quality_rating(completed_session_recent, 10.5)
+            await sleep_service.add_quality_rating(completed_session_recent, rating)
 
     @pytest.mark.asyncio
     async def test_add_quality_rating_to_active_session(
-        self, sleep_service: SleepService, async_session, test_user: User
+        self, sleep_service: SleepService, active_session: SleepSession
     ):
         """Test that adding rating to active session raises ValueError."""
-        now = datetime.now(pytz.UTC)
-        active_session = SleepSession(
-            user_id=test_user.id,
-            sleep_start=now - timedelta(hours=1),
-            sleep_end=None,
-            duration_hours=None,
-        )
-        async_session.add(active_session)
-        await async_session.commit()
-        await async_session.refresh(active_session)
-
         with pytest.raises(ValueError, match="Cannot rate an active sleep session"):
             await sleep_service.add_quality_rating(active_session, 8.0)
 
@@ -157,68 +131,41 @@ class TestSleepServiceValidation:
 
     @pytest.mark.asyncio
     async def test_add_note_to_active_session(
-        self, sleep_service: SleepService, async_session, test_user: User
+        self, sleep_service: SleepService, active_session: SleepSession
     ):
         """Test that adding note to active session raises ValueError."""
-        now = datetime.now(pytz.UTC)
-        active_session = SleepSession(
-            user_id=test_user.id,
-            sleep_start=now - timedelta(hours=1),
-            sleep_end=None,
-            duration_hours=None,
-        )
-        async_session.add(active_session)
-        await async_session.commit()
-        await async_session.refresh(active_session)
-
         with pytest.raises(ValueError, match="Cannot add note to an active sleep session"):
             await sleep_service.add_note(active_session, "Test note")
 
-    @pytest.mark.asyncio
-    async def test_format_time_ago_minutes(self, sleep_service: SleepService):
-        """Test formatting time ago for minutes."""
-        hours = 0.5  # 30 minutes
-        result = sleep_service.format_time_ago(hours)
-        assert "30 minutes ago" in result
-
-    @pytest.mark.asyncio
-    async def test_format_time_ago_hours(self, sleep_service: SleepService):
-        """Test formatting time ago for hours."""
-        hours = 5.7
-        result = sleep_service.format_time_ago(hours)
-        assert "5 hours ago" in result
-
-    @pytest.mark.asyncio
-    async def test_format_time_ago_days(self, sleep_service: SleepService):
-        """Test formatting time ago for days."""
-        hours = 48.5  # 2 days
-        result = sleep_service.format_time_ago(hours)
-        assert "2 days ago" in result
+    @pytest.mark.parametrize(
+        "hours, expected",
+        [(0.5, "30 minutes ago"), (5.7, "5 hours ago"), (48.5, "2 days ago")],
+    )
+    def test_format_time_ago(self, sleep_service: SleepService, hours: float, expected: str):
+        """Test formatting time ago for minutes, hours and days."""
+        assert expected in sleep_service.format_time_ago(hours)
 
     @pytest.mark.asyncio
     async def test_get_last_completed_session_returns_most_recent(
         self, sleep_service: SleepService, test_user_with_sessions: User, async_session
     ):
         """Test that get_last_completed_session returns the most recent completed session."""
-        from sqlalchemy import select
-        from models.sleep_session import SleepSession
-
         last_session = await sleep_service.get_last_completed_session(test_user_with_sessions)
 
         assert last_session is not None
         assert last_session.sleep_end is not None
 
         # Verify it's the most recent completed session (not the active one)
-        result = await async_session.execute(
-            select(SleepSession)
-            .where(SleepSession.user_id == test_user_with_sessions.id)
-            .where(SleepSession.sleep_end.is_not(None))
-            .order_by(SleepSession.sleep_end.desc())
-        )
-        all_sessions = list(result.scalars().all())
-        # The returned session should be the most recent completed one
-        assert len(all_sessions) > 0
-        assert last_session.id == all_sessions[0].id
+        most_recent_id = (
+            await async_session.execute(
+                select(SleepSession.id)
+                .where(SleepSession.user_id == test_user_with_sessions.id)
+                .where(SleepSession.sleep_end.is_not(None))
+                .order_by(SleepSession.sleep_end.desc())
+                .limit(1)
+            )
+        ).scalar_one()
+        assert last_session.id == most_recent_id
 
     @pytest.mark.asyncio
     async def test_get_last_completed_session_no_sessions(
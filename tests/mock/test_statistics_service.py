@@ -1,11 +1,10 @@
 """Mock tests for statistics service."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
-import pytz
 
-from services.statistics_service import StatisticsService
+from services.statistics_service import EXPORT_FIELDNAMES, StatisticsService
 
 
 class TestStatisticsService:
@@ -13,10 +12,9 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_get_statistics_no_data(
-        self, async_session, test_user
+        self, stats_service: StatisticsService, test_user
     ):
         """Test getting statistics when user has no data."""
-        stats_service = StatisticsService(async_session)
         stats = await stats_service.get_statistics(test_user)
 
         assert stats["total_sessions"] == 0
@@ -26,10 +24,9 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_get_statistics_with_data(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test getting statistics with existing data."""
-        stats_service = StatisticsService(async_session)
         stats = await stats_service.get_statistics(test_user_with_sessions)
 
         assert stats["total_sessions"] >= 2  # We have at least 2 completed sessions
@@ -38,11 +35,10 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_get_statistics_with_date_range(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test getting statistics with date range filter."""
-        stats_service = StatisticsService(async_session)
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
 
         # Get statistics for last 24 hours only
         start_date = now - timedelta(hours=24)
@@ -57,10 +53,9 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_prepare_export_data_no_sessions(
-        self, async_session, test_user
+        self, stats_service: StatisticsService, test_user
     ):
         """Test preparing export data when user has no sessions."""
-        stats_service = StatisticsService(async_session)
         export_data = await stats_service.prepare_export_data(test_user)
 
         assert isinstance(export_data, list)
@@ -68,10 +63,9 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_prepare_export_data_with_sessions(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test preparing export data with existing sessions."""
-        stats_service = StatisticsService(async_session)
         export_data = await stats_service.prepare_export_data(test_user_with_sessions)
 
         assert isinstance(export_data, list)
@@ -88,11 +82,10 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_prepare_export_data_with_date_range(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test preparing export data with date range filter."""
-        stats_service = StatisticsService(async_session)
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
 
         # Get data for last 24 hours only
         start_date = now - timedelta(hours=24)
@@ -108,10 +101,9 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_prepare_export_data_formats_correctly(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test that export data is formatted correctly."""
-        stats_service = StatisticsService(async_session)
         export_data = await stats_service.prepare_export_data(test_user_with_sessions)
 
         assert len(export_data) > 0
@@ -127,10 +119,45 @@ class TestStatisticsService:
             assert len(record["sleep_end"]) == 19
             assert " " in record["sleep_end"]
 
-    def test_format_export_message_basic(self, async_session):
-        """Test formatting export message with basic stats."""
-        stats_service = StatisticsService(async_session)
+    @pytest.mark.asyncio
+    async def test_prepare_export_data_columns(
+        self, stats_service: StatisticsService, test_user_with_sessions
+    ):
+        """Test that export records have exactly the EXPORT_FIELDNAMES columns in order."""
+        export_data = await stats_service.prepare_export_data(test_user_with_sessions)
+
+        assert all(tuple(record) == EXPORT_FIELDNAMES for record in export_data)
+
+    @pytest.mark.asyncio
+    async def test_get_statistics_with_export_data(
+        self, stats_service: StatisticsService, test_user_with_sessions
+    ):
+        """Test getting statistics and export data together on one session."""
+        stats, export_data = await stats_service.get_statistics_with_export_data(
+            test_user_with_sessions
+        )
+
+        assert stats["total_sessions"] == len(export_data)
+        assert len(export_data) >= 2
 
+    @pytest.mark.asyncio
+    async def test_get_statistics_with_export_data_concurrent(
+        self, async_session, session_maker, test_user_with_sessions
+    ):
+        """Test getting statistics and export data concurrently on separate sessions."""
+        sequential = StatisticsService(async_session)
+        concurrent = StatisticsService(async_session, session_maker=session_maker)
+
+        stats, export_data = await concurrent.get_statistics_with_export_data(
+            test_user_with_sessions
+        )
+
+        assert stats == await sequential.get_statistics(test_user_with_sessions)
+        assert export_data == await sequential.prepare_export_data(test_user_with_sessions)
+        assert stats["total_sessions"] == len(export_data) == 2
+
+    def test_format_export_message_basic(self):
+        """Test formatting export message with basic stats."""
         stats = {
             "total_sessions": 10,
             "avg_duration": 7.5,
@@ -138,7 +165,7 @@ class TestStatisticsService:
             "total_sleep_hours": 75.0,
         }
 
-        message = stats_service.format_export_message(stats, total_records=10)
+        message = StatisticsService.format_export_message(stats, total_records=10)
 
         assert "Sleep Statistics Export" in message
         assert "Total sessions: 10" in message
@@ -146,10 +173,8 @@ class TestStatisticsService:
         assert "Average quality: 8.2/10" in message
         assert "Total sleep: 75.0h" in message
 
-    def test_format_export_message_with_date_range(self, async_session):
+    def test_format_export_message_with_date_range(self):
         """Test formatting export message with date range."""
-        stats_service = StatisticsService(async_session)
-
         stats = {
             "total_sessions": 5,
             "avg_duration": 8.0,
@@ -157,7 +182,7 @@ class TestStatisticsService:
             "total_sleep_hours": 40.0,
         }
 
-        message = stats_service.format_export_message(
+        message = StatisticsService.format_export_message(
             stats,
             total_records=5,
             date_range="2024-01-01 to 2024-01-07"
@@ -168,10 +193,8 @@ class TestStatisticsService:
         # Should not include average quality if it's 0
         assert "Average quality" not in message
 
-    def test_format_export_message_without_quality(self, async_session):
+    def test_format_export_message_without_quality(self):
         """Test formatting export message without quality ratings."""
-        stats_service = StatisticsService(async_session)
-
         stats = {
             "total_sessions": 3,
             "avg_duration": 6.5,
@@ -179,7 +202,7 @@ class TestStatisticsService:
             "total_sleep_hours": 19.5,
         }
 
-        message = stats_service.format_export_message(stats, total_records=3)
+        message = StatisticsService.format_export_message(stats, total_records=3)
 
         assert "Total sessions: 3" in message
         assert "Average duration: 6.5h" in message
@@ -189,20 +212,18 @@ class TestStatisticsService:
 
     @pytest.mark.asyncio
     async def test_has_any_data_true(
-        self, async_session, test_user_with_sessions
+        self, stats_service: StatisticsService, test_user_with_sessions
     ):
         """Test has_any_data returns True when user has data."""
-        stats_service = StatisticsService(async_session)
         has_data = await stats_service.has_any_data(test_user_with_sessions)
 
         assert has_data is True
 
     @pytest.mark.asyncio
     async def test_has_any_data_false(
-        self, async_session, test_user
+        self, stats_service: StatisticsService, test_user
     ):
         """Test has_any_data returns False when user has no data."""
-        stats_service = StatisticsService(async_session)
         has_data = await stats_service.has_any_data(test_user)
 
         assert has_data is False
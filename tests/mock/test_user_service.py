@@ -59,16 +59,19 @@ class TestUserService:
         assert user.language_code == "en"  # Should fallback to 'en'
 
     @pytest.mark.asyncio
-    async def test_get_or_create_user_supported_languages(self, user_service: UserService):
+    @pytest.mark.parametrize(
+        ("lang", "telegram_id"), [("en", 10001), ("ru", 10002), ("et", 10003)]
+    )
+    async def test_get_or_create_user_supported_languages(
+        self, user_service: UserService, lang: str, telegram_id: int
+    ):
         """Test that supported languages are preserved."""
-        lang_ids = {"en": 10001, "ru": 10002, "et": 10003}
-        for lang in ["en", "ru", "et"]:
-            user, is_created = await user_service.get_or_create_user(
-                telegram_id=lang_ids[lang],
-                language_code=lang,
-                username=f"user_{lang}",
-            )
-            assert user.language_code == lang
+        user, is_created = await user_service.get_or_create_user(
+            telegram_id=telegram_id,
+            language_code=lang,
+            username=f"user_{lang}",
+        )
+        assert user.language_code == lang
 
     @pytest.mark.asyncio
     async def test_get_user_by_telegram_id_found(
@@ -109,6 +112,20 @@ class TestUserService:
         assert updated_user.timezone == "Europe/Tallinn"
         assert updated_user.id == test_user.id
 
+    @pytest.mark.parametrize("timezone", ["UTC", "Europe/Tallinn", "America/New_York"])
+    def test_is_valid_timezone(self, timezone: str):
+        """Test that IANA timezone names are accepted."""
+        assert UserService.is_valid_timezone(timezone) is True
+
+    @pytest.mark.parametrize(
+        "timezone",
+        ["Europe", "Etc", "a" * 300, "Not/AZone", "", "../etc/passwd"],
+        ids=["zone-directory", "etc-directory", "too-long", "unknown", "empty", "path"],
+    )
+    def test_is_valid_timezone_rejects_invalid(self, timezone: str):
+        """Test that invalid names are rejected instead of raising."""
+        assert UserService.is_valid_timezone(timezone) is False
+
     @pytest.mark.asyncio
     async def test_complete_onboarding_without_goals(
         self, user_service: UserService, test_user: User
@@ -189,8 +206,7 @@ class TestUserService:
 
         assert user_service.is_onboarded(test_user) is True
 
-    @pytest.mark.asyncio
-    async def test_is_onboarded_false(self, user_service: UserService, test_user: User):
+    def test_is_onboarded_false(self, user_service: UserService, test_user: User):
         """Test is_onboarded returns False for non-onboarded user."""
         # test_user is not onboarded by default
         assert user_service.is_onboarded(test_user) is False
@@ -1,253 +1,188 @@
 """Unit tests for formatting functions in sleep_service.py."""
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
 from unittest.mock import Mock
 
 import pytest
-import pytz
 
 from services.sleep_service import SleepService
 
 
-@pytest.fixture
-def sleep_service():
-    """Create SleepService instance with mock session."""
-    mock_session = Mock()
-    return SleepService(mock_session)
+@dataclass(frozen=True, slots=True)
+class _GoalUser:
+    """Read-only user stand-in for goal percentage calculations."""
 
+    target_sleep_hours: Optional[float]
 
-class TestFormatDuration:
-    """Test format_duration function."""
-
-    def test_format_duration_whole_hours(self, sleep_service):
-        """Test formatting duration with whole hours."""
-        hours, minutes = sleep_service.format_duration(8.0)
-        assert hours == 8
-        assert minutes == 0
-
-    def test_format_duration_with_minutes(self, sleep_service):
-        """Test formatting duration with hours and minutes."""
-        hours, minutes = sleep_service.format_duration(7.5)
-        assert hours == 7
-        assert minutes == 30
-
-    def test_format_duration_quarter_hour(self, sleep_service):
-        """Test formatting duration with quarter hour."""
-        hours, minutes = sleep_service.format_duration(5.25)
-        assert hours == 5
-        assert minutes == 15
-
-    def test_format_duration_three_quarters(self, sleep_service):
-        """Test formatting duration with three quarters."""
-        hours, minutes = sleep_service.format_duration(9.75)
-        assert hours == 9
-        assert minutes == 45
-
-    def test_format_duration_less_than_hour(self, sleep_service):
-        """Test formatting duration less than one hour."""
-        hours, minutes = sleep_service.format_duration(0.5)
-        assert hours == 0
-        assert minutes == 30
-
-    def test_format_duration_fractional_minutes(self, sleep_service):
-        """Test formatting duration with fractional minutes."""
-        hours, minutes = sleep_service.format_duration(7.33)
-        assert hours == 7
-        assert minutes == 19  # 0.33 * 60 = 19.8 -> 19
-
-    def test_format_duration_zero(self, sleep_service):
-        """Test formatting zero duration."""
-        hours, minutes = sleep_service.format_duration(0.0)
-        assert hours == 0
-        assert minutes == 0
-
-    def test_format_duration_large_value(self, sleep_service):
-        """Test formatting large duration value."""
-        hours, minutes = sleep_service.format_duration(23.99)
-        assert hours == 23
-        assert minutes == 59
 
+@dataclass(frozen=True, slots=True)
+class _GoalSession:
+    """Read-only session stand-in for goal percentage calculations."""
 
-class TestFormatTimeAgo:
-    """Test format_time_ago function."""
+    duration_hours: Optional[float]
 
-    def test_format_time_ago_minutes(self, sleep_service):
-        """Test formatting time less than 1 hour ago."""
-        result = sleep_service.format_time_ago(0.5)
-        assert result == "30 minutes ago"
-
-    def test_format_time_ago_one_minute(self, sleep_service):
-        """Test formatting 1 minute ago."""
-        result = sleep_service.format_time_ago(0.016)  # ~1 minute
-        assert result == "0 minutes ago"
-
-    def test_format_time_ago_59_minutes(self, sleep_service):
-        """Test formatting 59 minutes ago."""
-        result = sleep_service.format_time_ago(0.99)
-        assert result == "59 minutes ago"
-
-    def test_format_time_ago_one_hour(self, sleep_service):
-        """Test formatting exactly 1 hour ago."""
-        result = sleep_service.format_time_ago(1.0)
-        assert result == "1 hours ago"
-
-    def test_format_time_ago_multiple_hours(self, sleep_service):
-        """Test formatting multiple hours ago."""
-        result = sleep_service.format_time_ago(5.3)
-        assert result == "5 hours ago"
-
-    def test_format_time_ago_23_hours(self, sleep_service):
-        """Test formatting 23 hours ago (just under 1 day)."""
-        result = sleep_service.format_time_ago(23.5)
-        assert result == "23 hours ago"
-
-    def test_format_time_ago_one_day(self, sleep_service):
-        """Test formatting exactly 1 day ago."""
-        result = sleep_service.format_time_ago(24.0)
-        assert result == "1 days ago"
-
-    def test_format_time_ago_multiple_days(self, sleep_service):
-        """Test formatting multiple days ago."""
-        result = sleep_service.format_time_ago(72.5)
-        assert result == "3 days ago"
-
-    def test_format_time_ago_one_week(self, sleep_service):
-        """Test formatting one week ago."""
-        result = sleep_service.format_time_ago(168.0)
-        assert result == "7 days ago"
-
-    def test_format_time_ago_zero(self, sleep_service):
-        """Test formatting zero hours ago."""
-        result = sleep_service.format_time_ago(0.0)
-        assert result == "0 minutes ago"
 
+# Fixed instants shared by the parametrized cases below (all 2026-01-14 UTC)
+_UTC_0000 = datetime(2026, 1, 14, 0, 0, 0, tzinfo=timezone.utc)
+_UTC_0905 = datetime(2026, 1, 14, 9, 5, 0, tzinfo=timezone.utc)
+_UTC_1330 = datetime(2026, 1, 14, 13, 30, 0, tzinfo=timezone.utc)
+_UTC_1500 = datetime(2026, 1, 14, 15, 0, 0, tzinfo=timezone.utc)
+_UTC_1530 = datetime(2026, 1, 14, 15, 30, 0, tzinfo=timezone.utc)
+_UTC_2000 = datetime(2026, 1, 14, 20, 0, 0, tzinfo=timezone.utc)
 
-class TestCalculateGoalPercentage:
-    """Test calculate_goal_percentage function."""
 
-    def test_calculate_goal_percentage_100_percent(self, sleep_service):
-        """Test calculating goal percentage when exactly meeting goal."""
-        user = Mock(target_sleep_hours=8.0)
-        session = Mock(duration_hours=8.0)
-
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 100
-
-    def test_calculate_goal_percentage_over_100(self, sleep_service):
-        """Test calculating goal percentage when exceeding goal."""
-        user = Mock(target_sleep_hours=8.0)
-        session = Mock(duration_hours=10.0)
-
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 125
-
-    def test_calculate_goal_percentage_under_100(self, sleep_service):
-        """Test calculating goal percentage when under goal."""
-        user = Mock(target_sleep_hours=8.0)
-        session = Mock(duration_hours=6.0)
-
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 75
-
-    def test_calculate_goal_percentage_50_percent(self, sleep_service):
-        """Test calculating 50% of goal."""
-        user = Mock(target_sleep_hours=8.0)
-        session = Mock(duration_hours=4.0)
-
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 50
+@pytest.fixture(scope="module")
+def sleep_service():
+    """Create SleepService instance with mock session.
 
-    def test_calculate_goal_percentage_fractional(self, sleep_service):
-        """Test calculating goal percentage with fractional hours."""
-        user = Mock(target_sleep_hours=7.5)
-        session = Mock(duration_hours=6.0)
+    Module-scoped: the formatters under test never touch the session.
+    """
+    mock_session = Mock()
+    return SleepService(mock_session)
 
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 80  # 6.0 / 7.5 = 0.8
 
-    def test_calculate_goal_percentage_no_target(self, sleep_service):
-        """Test calculating goal percentage when user has no target."""
-        user = Mock(target_sleep_hours=None)
-        session = Mock(duration_hours=8.0)
+class TestFormatDuration:
+    """Test format_duration function."""
 
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage is None
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (8.0, (8, 0)),  # whole hours
+            (7.5, (7, 30)),
+            (5.25, (5, 15)),  # quarter hour
+            (9.75, (9, 45)),  # three quarters
+            (0.5, (0, 30)),  # less than an hour
+            (7.33, (7, 20)),  # 0.33 * 60 = 19.8 -> rounds to 20
+            (0.0, (0, 0)),
+            (23.99, (23, 59)),
+        ],
+    )
+    def test_format_duration(self, sleep_service, value, expected):
+        """Test splitting a duration in hours into (hours, minutes)."""
+        assert sleep_service.format_duration(value) == expected
 
-    def test_calculate_goal_percentage_no_duration(self, sleep_service):
-        """Test calculating goal percentage when session has no duration."""
-        user = Mock(target_sleep_hours=8.0)
-        session = Mock(duration_hours=None)
 
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage is None
+class TestFormatTimeAgo:
+    """Test format_time_ago function."""
 
-    def test_calculate_goal_percentage_both_none(self, sleep_service):
-        """Test calculating goal percentage when both are None."""
-        user = Mock(target_sleep_hours=None)
-        session = Mock(duration_hours=None)
+    @pytest.mark.parametrize(
+        ("hours", "expected"),
+        [
+            (0.0, "0 minutes ago"),
+            (0.016, "0 minutes ago"),  # ~1 minute, truncated
+            (0.5, "30 minutes ago"),
+            (0.99, "59 minutes ago"),
+            (1.0, "1 hours ago"),
+            (5.3, "5 hours ago"),
+            (23.5, "23 hours ago"),  # just under 1 day
+            (24.0, "1 days ago"),
+            (72.5, "3 days ago"),
+            (168.0, "7 days ago"),  # one week
+        ],
+    )
+    def test_format_time_ago(self, sleep_service, hours, expected):
+        """Test formatting hours ago as minutes, hours or days."""
+        assert sleep_service.format_time_ago(hours) == expected
 
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage is None
 
-    def test_calculate_goal_percentage_very_high(self, sleep_service):
-        """Test calculating goal percentage with very high value."""
-        user = Mock(target_sleep_hours=6.0)
-        session = Mock(duration_hours=12.0)
+class TestCalculateGoalPercentage:
+    """Test calculate_goal_percentage function."""
 
-        percentage = sleep_service.calculate_goal_percentage(user, session)
-        assert percentage == 200
+    @pytest.mark.parametrize(
+        ("target", "duration", "expected"),
+        [
+            (8.0, 8.0, 100),
+            (8.0, 10.0, 125),
+            (8.0, 6.0, 75),
+            (8.0, 4.0, 50),
+            (7.5, 6.0, 80),  # 6.0 / 7.5 = 0.8
+            (6.0, 12.0, 200),
+            (None, 8.0, None),  # no target
+            (8.0, None, None),  # no duration
+            (None, None, None),
+        ],
+    )
+    def test_calculate_goal_percentage(self, sleep_service, target, duration, expected):
+        """Test calculating what percentage of the sleep goal was achieved."""
+        user = _GoalUser(target)
+        session = _GoalSession(duration)
+
+        assert sleep_service.calculate_goal_percentage(user, session) == expected
+
+    def test_calculate_goal_percentages_batch(self, sleep_service):
+        """Test batch calculation matches the per-session helper."""
+        user = _GoalUser(7.5)
+        sessions = [_GoalSession(h) for h in (6.0, 7.5, None, 9.0)]
+
+        percentages = sleep_service.calculate_goal_percentages(user, sessions)
+        assert percentages == [sleep_service.calculate_goal_percentage(user, s) for s in sessions]
+        assert percentages == [80, 100, None, 120]
+
+    def test_calculate_goal_percentages_no_target(self, sleep_service):
+        """Test batch calculation without a target returns all None."""
+        user = _GoalUser(None)
+        sessions = [_GoalSession(8.0), _GoalSession(6.0)]
+
+        assert sleep_service.calculate_goal_percentages(user, sessions) == [None, None]
 
 
 class TestFormatTimeForUser:
     """Test format_time_for_user function."""
 
-    def test_format_time_for_user_utc(self, sleep_service):
-        """Test formatting time for user in UTC timezone."""
-        user = Mock(timezone="UTC")
-        dt = datetime(2026, 1, 14, 15, 30, 0, tzinfo=pytz.UTC)
-
-        result = sleep_service.format_time_for_user(dt, user)
-        assert result == "15:30"
-
-    def test_format_time_for_user_tallinn(self, sleep_service):
-        """Test formatting time for user in Tallinn timezone."""
-        user = Mock(timezone="Europe/Tallinn")
-        dt = datetime(2026, 1, 14, 13, 30, 0, tzinfo=pytz.UTC)  # 13:30 UTC
-
-        result = sleep_service.format_time_for_user(dt, user)
-        # Tallinn is UTC+2 in winter
-        assert result == "15:30"
-
-    def test_format_time_for_user_new_york(self, sleep_service):
-        """Test formatting time for user in New York timezone."""
-        user = Mock(timezone="America/New_York")
-        dt = datetime(2026, 1, 14, 20, 0, 0, tzinfo=pytz.UTC)  # 20:00 UTC
-
-        result = sleep_service.format_time_for_user(dt, user)
-        # New York is UTC-5 in winter
-        assert result == "15:00"
-
-    def test_format_time_for_user_midnight(self, sleep_service):
-        """Test formatting midnight time."""
-        user = Mock(timezone="UTC")
-        dt = datetime(2026, 1, 14, 0, 0, 0, tzinfo=pytz.UTC)
-
-        result = sleep_service.format_time_for_user(dt, user)
-        assert result == "00:00"
-
-    def test_format_time_for_user_single_digit_hour(self, sleep_service):
-        """Test formatting time with single digit hour."""
-        user = Mock(timezone="UTC")
-        dt = datetime(2026, 1, 14, 9, 5, 0, tzinfo=pytz.UTC)
-
-        result = sleep_service.format_time_for_user(dt, user)
-        assert result == "09:05"
-
-    def test_format_time_for_user_tokyo(self, sleep_service):
-        """Test formatting time for user in Tokyo timezone."""
-        user = Mock(timezone="Asia/Tokyo")
-        dt = datetime(2026, 1, 14, 15, 0, 0, tzinfo=pytz.UTC)  # 15:00 UTC
-
-        result = sleep_service.format_time_for_user(dt, user)
-        # Tokyo is UTC+9
-        assert result == "00:00"  # Next day
+    @pytest.mark.parametrize(
+        ("timezone", "dt", "expected"),
+        [
+            ("UTC", _UTC_1530, "15:30"),
+            ("Europe/Tallinn", _UTC_1330, "15:30"),  # Tallinn is UTC+2 in winter
+            ("America/New_York", _UTC_2000, "15:00"),  # New York is UTC-5 in winter
+            ("UTC", _UTC_0000, "00:00"),  # midnight
+            ("UTC", _UTC_0905, "09:05"),  # zero-padded
+            ("Asia/Tokyo", _UTC_1500, "00:00"),  # Tokyo is UTC+9, so the next day
+        ],
+    )
+    def test_format_time_for_user(self, sleep_service, timezone, dt, expected):
+        """Test formatting a UTC datetime as HH:MM in the user's timezone."""
+        user = SimpleNamespace(timezone=timezone)
+
+        assert sleep_service.format_time_for_user(dt, user) == expected
+
+
+class TestRenderSessions:
+    """Test render_sessions function."""
+
+    def test_render_sessions_matches_helpers(self, sleep_service):
+        """Test that batch rendering matches the per-field helpers."""
+        user = SimpleNamespace(timezone="Europe/Tallinn", target_sleep_hours=8.0)
+        session = SimpleNamespace(
+            sleep_start=datetime(2026, 1, 13, 21, 0, 0, tzinfo=timezone.utc),
+            sleep_end=datetime(2026, 1, 14, 4, 30, 0, tzinfo=timezone.utc),
+            duration_hours=7.5,
+        )
+
+        [row] = sleep_service.render_sessions(user, [session])
+        assert row == {
+            "sleep_time": sleep_service.format_time_for_user(session.sleep_start, user),
+            "wake_time": sleep_service.format_time_for_user(session.sleep_end, user),
+            "hours": 7,
+            "minutes": 30,
+            "goal_percentage": sleep_service.calculate_goal_percentage(user, session),
+        }
+        assert row["sleep_time"] == "23:00"
+        assert row["wake_time"] == "06:30"
+
+    def test_render_sessions_no_target(self, sleep_service):
+        """Test rendering naive datetimes for a user without a goal."""
+        user = SimpleNamespace(timezone="UTC", target_sleep_hours=None)
+        session = SimpleNamespace(
+            sleep_start=datetime(2026, 1, 13, 22, 0, 0),
+            sleep_end=datetime(2026, 1, 14, 6, 0, 0),
+            duration_hours=8.0,
+        )
+
+        [row] = sleep_service.render_sessions(user, [session])
+        assert row["sleep_time"] == "22:00"
+        assert row["wake_time"] == "06:00"
+        assert row["goal_percentage"] is None
@@ -0,0 +1,25 @@
+"""Unit tests for the chunked upload file."""
+
+from utils.input_file import ChunkedInputFile
+
+
+class TestChunkedInputFile:
+    """Test ChunkedInputFile class."""
+
+    async def test_read_yields_chunks(self):
+        """Test that read yields the chunks produced by the factory."""
+        file = ChunkedInputFile(lambda: iter([b"a,b\r\n", b"1,2\r\n"]), filename="data.csv")
+
+        chunks = [chunk async for chunk in file.read(None)]
+
+        assert chunks == [b"a,b\r\n", b"1,2\r\n"]
+        assert file.filename == "data.csv"
+
+    async def test_read_is_repeatable(self):
+        """Test that every upload attempt gets the full content again."""
+        file = ChunkedInputFile(lambda: iter([b"x"]), filename="data.csv")
+
+        first = [chunk async for chunk in file.read(None)]
+        second = [chunk async for chunk in file.read(None)]
+
+        assert first == second == [b"x"]
@@ -1,5 +1,6 @@
 """Unit tests for keyboard builder functions."""
 
+from functools import partial
 from unittest.mock import Mock
 
 import pytest
@@ -15,6 +16,7 @@ from bot.keyboards.inline import (
     get_sleep_conflict_keyboard,
     get_stats_format_keyboard,
     get_stats_period_keyboard,
+    get_timezone_popular_keyboard,
 )
 
 
@@ -36,13 +38,15 @@ class TestLanguageKeyboard:
     def test_button_callback_data(self):
         """Test that buttons have correct callback data."""
         keyboard = get_language_keyboard()
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "lang_en" in callback_data
         assert "lang_ru" in callback_data
         assert "lang_et" in callback_data
 
+    def test_is_built_once(self):
+        """Test that repeated calls return the same cached keyboard."""
+        assert get_language_keyboard() is get_language_keyboard()
+
 
 class TestSleepConflictKeyboard:
     """Test get_sleep_conflict_keyboard function."""
@@ -61,18 +65,14 @@ class TestSleepConflictKeyboard:
     def test_displays_duration_in_button_text(self):
         """Test that duration is displayed in save button text."""
         keyboard = get_sleep_conflict_keyboard(8, 45)
-        button_texts = [
-            button.text for row in keyboard.inline_keyboard for button in row
-        ]
+        button_texts = [button.text for row in keyboard.inline_keyboard for button in row]
         # Check that at least one button contains the duration
         assert any("8h" in text and "45m" in text for text in button_texts)
 
     def test_callback_data_values(self):
         """Test that buttons have correct callback data."""
         keyboard = get_sleep_conflict_keyboard(5, 15)
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "sleep_save_and_start" in callback_data
         assert "sleep_continue" in callback_data
         assert "sleep_cancel_and_start" in callback_data
@@ -101,9 +101,7 @@ class TestStatsPeriodKeyboard:
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
         keyboard = get_stats_period_keyboard(loc, "en")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "stats_period_week" in callback_data
         assert "stats_period_month" in callback_data
         assert "stats_period_all" in callback_data
@@ -113,13 +111,23 @@ class TestStatsPeriodKeyboard:
         """Test that localization service is called for button texts."""
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: f"translated_{key}")
-        keyboard = get_stats_period_keyboard(loc, "ru")
+        get_stats_period_keyboard(loc, "ru")
 
         # Check that loc.get was called
         assert loc.get.called
         # Check language was passed
         assert any(call[0][1] == "ru" for call in loc.get.call_args_list)
 
+    def test_cached_per_language(self):
+        """Test that keyboards are cached per language and translated once."""
+        loc = Mock()
+        loc.get = Mock(side_effect=lambda key, lang: f"{lang}_{key}")
+        keyboard = get_stats_period_keyboard(loc, "en")
+
+        assert get_stats_period_keyboard(loc, "en") is keyboard
+        assert loc.get.call_count == 4
+        assert get_stats_period_keyboard(loc, "ru") is not keyboard
+
 
 class TestStatsFormatKeyboard:
     """Test get_stats_format_keyboard function."""
@@ -144,9 +152,7 @@ class TestStatsFormatKeyboard:
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
         keyboard = get_stats_format_keyboard(loc, "en")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "stats_format_csv" in callback_data
         assert "stats_format_json" in callback_data
         assert "stats_back" in callback_data
@@ -169,25 +175,19 @@ class TestConfirmationKeyboard:
     def test_uses_custom_confirm_data(self):
         """Test that custom confirm callback data is used."""
         keyboard = get_confirmation_keyboard("custom_confirm")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "custom_confirm" in callback_data
 
     def test_uses_default_cancel_data(self):
         """Test that default cancel callback data is used."""
         keyboard = get_confirmation_keyboard("confirm_action")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "cancel" in callback_data
 
     def test_uses_custom_cancel_data(self):
         """Test that custom cancel callback data can be provided."""
         keyboard = get_confirmation_keyboard("confirm_action", "custom_cancel")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "custom_cancel" in callback_data
 
 
@@ -217,6 +217,11 @@ class TestBackButton:
         button = keyboard.inline_keyboard[0][0]
         assert button.callback_data == "custom_back"
 
+    def test_cached_per_callback_data(self):
+        """Test that keyboards are cached separately for each callback data."""
+        assert get_back_button("custom_back") is get_back_button("custom_back")
+        assert get_back_button("custom_back") is not get_back_button()
+
 
 class TestQualityRatingKeyboard:
     """Test get_quality_rating_keyboard function."""
@@ -242,18 +247,14 @@ class TestQualityRatingKeyboard:
     def test_callback_data_format(self):
         """Test that callback data follows quality_rate_N format."""
         keyboard = get_quality_rating_keyboard()
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         for i in range(1, 11):
             assert f"quality_rate_{i}" in callback_data
 
     def test_button_text_matches_rating(self):
         """Test that button text matches the rating number."""
         keyboard = get_quality_rating_keyboard()
-        button_texts = [
-            button.text for row in keyboard.inline_keyboard for button in row
-        ]
+        button_texts = [button.text for row in keyboard.inline_keyboard for button in row]
         for i in range(1, 11):
             assert str(i) in button_texts
 
@@ -281,9 +282,7 @@ class TestQualityConfirmationKeyboard:
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
         keyboard = get_quality_confirmation_keyboard(7.5, loc, "en")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "quality_confirm_7.5" in callback_data
 
     def test_cancel_callback_data(self):
@@ -291,16 +290,14 @@ class TestQualityConfirmationKeyboard:
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
         keyboard = get_quality_confirmation_keyboard(9.0, loc, "en")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "quality_cancel" in callback_data
 
     def test_uses_localization(self):
         """Test that localization service is used for button texts."""
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
-        keyboard = get_quality_confirmation_keyboard(8.0, loc, "ru")
+        get_quality_confirmation_keyboard(8.0, loc, "ru")
 
         # Check that loc.get was called for confirm and cancel buttons
         assert loc.get.call_count >= 2
@@ -329,9 +326,7 @@ class TestNoteConfirmationKeyboard:
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
         keyboard = get_note_confirmation_keyboard(loc, "en")
-        callback_data = [
-            button.callback_data for row in keyboard.inline_keyboard for button in row
-        ]
+        callback_data = [button.callback_data for row in keyboard.inline_keyboard for button in row]
         assert "note_confirm" in callback_data
         assert "note_cancel" in callback_data
 
@@ -339,9 +334,43 @@ class TestNoteConfirmationKeyboard:
         """Test that localization service is used for button texts."""
         loc = Mock()
         loc.get = Mock(side_effect=lambda key, lang: key)
-        keyboard = get_note_confirmation_keyboard(loc, "et")
+        get_note_confirmation_keyboard(loc, "et")
 
         # Check that loc.get was called
         assert loc.get.called
         # Check that the correct language was used
         assert any(call[0][1] == "et" for call in loc.get.call_args_list)
+
+
+class TestLocalizedKeyboardCache:
+    """Test caching of localized keyboards."""
+
+    @pytest.mark.parametrize(
+        ("build", "key"),
+        [
+            pytest.param(get_stats_period_keyboard, "commands.stats.period_week", id="period"),
+            pytest.param(get_stats_format_keyboard, "commands.stats.format_csv", id="format"),
+            pytest.param(get_note_confirmation_keyboard, "buttons.confirm", id="note"),
+            pytest.param(
+                partial(get_quality_confirmation_keyboard, 7.5), "buttons.confirm", id="quality"
+            ),
+            pytest.param(
+                get_timezone_popular_keyboard,
+                "commands.start.onboarding.timezone_other",
+                id="timezone",
+            ),
+        ],
+    )
+    def test_shared_per_language(self, build, key, localization_service):
+        """Test that repeated calls share one markup and other languages get their own."""
+        keyboard_en = build(localization_service, "en")
+        assert build(localization_service, "en") is keyboard_en
+
+        keyboard_ru = build(localization_service, "ru")
+        assert keyboard_ru is not keyboard_en
+
+        texts_en = [button.text for row in keyboard_en.inline_keyboard for button in row]
+        texts_ru = [button.text for row in keyboard_ru.inline_keyboard for button in row]
+        assert localization_service.get(key, "en") in texts_en
+        assert localization_service.get(key, "ru") in texts_ru
+        assert localization_service.get(key, "en") not in texts_ru
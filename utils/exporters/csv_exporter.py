@@ -1,11 +1,75 @@
 import csv
+from collections.abc import Iterable, Iterator, Sequence
 from io import StringIO
-from typing import Any
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Optional
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Returned as-is for empty exports
+_EMPTY_CSV = ""
+_EMPTY_CSV_BYTES = b""
+
+
+def _row_values(rows: Iterable[dict[str, Any]], fieldnames: list[str]) -> Iterator[tuple]:
+    """Extract row values in column order.
+
+    Uses one operator.itemgetter for all rows instead of csv.DictWriter's
+    per-row lookups. Rows missing a column get an empty value, as with
+    DictWriter; extra keys are ignored.
+
+    Args:
+        rows: Sleep session dictionaries
+        fieldnames: Column order
+
+    Yields:
+        Tuple of values per row
+    """
+    getter = itemgetter(*fieldnames)
+    defaults = dict.fromkeys(fieldnames, "")
+    single = len(fieldnames) == 1
+    for row in rows:
+        try:
+            values = getter(row)
+        except KeyError:
+            values = getter({**defaults, **row})
+        yield (values,) if single else values
+
+
+def _join_plain(rows: list[Sequence[Any]], separators: int) -> Optional[str]:
+    """Join rows directly when no field needs CSV quoting.
+
+    Produces exactly what csv.writer would for such rows, without per-field
+    quoting checks in the csv module.
+
+    Args:
+        rows: Row values in column order
+        separators: Number of commas expected per line
+
+    Returns:
+        CSV text with a trailing line terminator, or None if any field needs quoting
+    """
+    lines = []
+    for values in rows:
+        line = ",".join(["" if value is None else str(value) for value in values])
+        # One probe per joined line: substring checks run in C and are far
+        # cheaper than stripping characters with str.translate
+        if (
+            not line
+            or line.count(",") != separators
+            or '"' in line
+            or "\r" in line
+            or "\n" in line
+        ):
+            return None
+        lines.append(line)
+
+    lines.append("")
+    return "\r\n".join(lines)
+
 
 class CSVExporter:
     """Exporter for sleep data to CSV format."""
@@ -25,24 +89,10 @@ class CSVExporter:
             >>> csv_string = CSVExporter.export(data)
         """
         if not data:
-            logger.warning("csv_export_empty_data")
-            return ""
-
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
-
-        # Write header
-        writer.writeheader()
+            logger.debug("csv_export_empty_data")
+            return _EMPTY_CSV
 
-        # Write rows
-        for row in data:
-            writer.writerow(row)
-
-        csv_string = output.getvalue()
-        output.close()
-
-        logger.info("csv_export_completed", rows=len(data))
-        return csv_string
+        return CSVExporter.export_to_bytes(data).decode("utf-8")
 
     @staticmethod
     def export_to_bytes(data: list[dict[str, Any]]) -> bytes:
@@ -54,5 +104,56 @@ class CSVExporter:
         Returns:
             CSV data as bytes
         """
-        csv_string = CSVExporter.export(data)
-        return csv_string.encode("utf-8")
+        if not data:
+            logger.debug("csv_export_empty_data")
+            return _EMPTY_CSV_BYTES
+
+        # One chunk: the whole export is serialized in a single pass
+        return b"".join(CSVExporter.iter_chunks(data, chunk_rows=len(data)))
+
+    @staticmethod
+    def iter_chunks(
+        data: list[dict[str, Any]],
+        chunk_rows: int = 500,
+        fieldnames: Optional[Sequence[str]] = None,
+    ) -> Iterator[bytes]:
+        """Export sleep data to CSV bytes chunk by chunk.
+
+        Only one chunk of encoded rows is held at a time. Chunks without
+        special characters are joined directly; others go through csv.writer.
+
+        Args:
+            data: List of sleep session dictionaries
+            chunk_rows: Number of rows per chunk
+            fieldnames: Column order; defaults to the keys of the first row.
+                Pass it to get a header even when there is no data.
+
+        Yields:
+            CSV data as bytes; the first chunk always contains the header
+        """
+        columns = list(fieldnames) if fieldnames else list(data[0].keys()) if data else []
+        if not columns:
+            logger.debug("csv_export_empty_data")
+            return
+
+        separators = len(columns) - 1
+        rows = iter(data)
+        chunk: list[Sequence[Any]] = [columns]
+        with StringIO() as output:
+            writer = csv.writer(output)
+            while True:
+                chunk.extend(_row_values(islice(rows, chunk_rows), columns))
+                if not chunk:
+                    break
+
+                text = _join_plain(chunk, separators)
+                if text is None:
+                    writer.writerows(chunk)
+                    text = output.getvalue()
+                    # Reuse the buffer for the next chunk
+                    output.seek(0)
+                    output.truncate()
+                yield text.encode("utf-8")
+                chunk = []
+
+        logger.info("csv_export_completed", rows=len(data))
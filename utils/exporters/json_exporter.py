@@ -1,10 +1,30 @@
-import json
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Returned as-is for empty exports
+_EMPTY_JSON = "[]"
+_EMPTY_JSON_BYTES = b"[]"
+
+
+def _dumps_bytes(data: list[dict[str, Any]]) -> bytes:
+    """Serialize data to UTF-8 JSON bytes in a single pass.
+
+    orjson only supports 2-space indentation, so every export uses it.
+
+    Args:
+        data: List of sleep session dictionaries
+
+    Returns:
+        JSON data as bytes
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
 
 class JSONExporter:
     """Exporter for sleep data to JSON format."""
@@ -15,7 +35,7 @@ class JSONExporter:
 
         Args:
             data: List of sleep session dictionaries
-            indent: JSON indentation level
+            indent: Kept for compatibility; output is always indented by 2 spaces
 
         Returns:
             JSON string
@@ -25,27 +45,64 @@ class JSONExporter:
             >>> json_string = JSONExporter.export(data)
         """
         if not data:
-            logger.warning("json_export_empty_data")
-            return "[]"
+            logger.debug("json_export_empty_data")
+            return _EMPTY_JSON
+
+        return JSONExporter.export_to_bytes(data, indent=indent).decode("utf-8")
+
+    @staticmethod
+    def export_to_bytes(data: list[dict[str, Any]], indent: int = 2) -> bytes:
+        """Export sleep data to JSON bytes (for file sending).
+
+        Args:
+            data: List of sleep session dictionaries
+            indent: Kept for compatibility; output is always indented by 2 spaces
+
+        Returns:
+            JSON data as bytes
+        """
+        if not data:
+            logger.debug("json_export_empty_data")
+            return _EMPTY_JSON_BYTES
 
         try:
-            json_string = json.dumps(data, indent=indent, ensure_ascii=False)
+            json_bytes = _dumps_bytes(data)
             logger.info("json_export_completed", rows=len(data))
-            return json_string
+            return json_bytes
         except Exception as e:
             logger.error("json_export_failed", error=str(e))
             raise
 
     @staticmethod
-    def export_to_bytes(data: list[dict[str, Any]], indent: int = 2) -> bytes:
-        """Export sleep data to JSON bytes (for file sending).
+    def iter_chunks(
+        data: list[dict[str, Any]], indent: int = 2, chunk_rows: int = 500
+    ) -> Iterator[bytes]:
+        """Export sleep data to JSON bytes chunk by chunk.
+
+        Each chunk of rows is serialized on its own and framed as one JSON
+        array, so large exports can be streamed without building the whole
+        document. Joined together the chunks equal export_to_bytes().
 
         Args:
             data: List of sleep session dictionaries
-            indent: JSON indentation level
+            indent: Kept for compatibility; output is always indented by 2 spaces
+            chunk_rows: Number of rows per chunk
 
-        Returns:
+        Yields:
             JSON data as bytes
         """
-        json_string = JSONExporter.export(data, indent=indent)
-        return json_string.encode("utf-8")
+        if not data:
+            logger.debug("json_export_empty_data")
+            yield _EMPTY_JSON_BYTES
+            return
+
+        yield b"[\n"
+        for start in range(0, len(data), chunk_rows):
+            if start:
+                yield b",\n"
+            end = start + chunk_rows
+            # Drop the "[\n" and "\n]" framing of the chunk's own array
+            yield _dumps_bytes(data[start:end])[2:-2]
+        yield b"\n]"
+
+        logger.info("json_export_completed", rows=len(data))
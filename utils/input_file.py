@@ -0,0 +1,30 @@
+from collections.abc import AsyncGenerator, Callable, Iterable
+
+from aiogram import Bot
+from aiogram.types import InputFile
+
+
+class ChunkedInputFile(InputFile):
+    """Upload file whose content is produced chunk by chunk during sending."""
+
+    def __init__(self, chunks: Callable[[], Iterable[bytes]], filename: str) -> None:
+        """Initialize chunked input file.
+
+        Args:
+            chunks: Factory returning the file content chunks; called on each upload
+            filename: Filename to be propagated to Telegram
+        """
+        super().__init__(filename=filename)
+        self.chunks = chunks
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        """Yield the file content for upload.
+
+        Args:
+            bot: Bot instance sending the file
+
+        Yields:
+            File content chunks
+        """
+        for chunk in self.chunks():
+            yield chunk
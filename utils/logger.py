@@ -1,31 +1,50 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import structlog
 from colorama import Fore, Style, init
 
 from config import settings
 
-# Initialize colorama for Windows compatibility
-init(autoreset=True)
+# Initialize colorama for Windows compatibility; production logs are plain
+# JSON, so stdout is left unwrapped there
+if not settings.is_production:
+    init(autoreset=True)
 
 
-def add_color_to_level(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-    """Add color to log level in development mode."""
-    level = event_dict.get("level", "").upper()
+_LOG_LEVEL = getattr(logging, settings.log_level.upper(), logging.INFO)
+
+# Noisy library loggers kept at warnings and errors only
+_QUIET_LOGGERS = ("sqlalchemy.engine", "sqlalchemy.pool", "sqlalchemy.dialects")
+
+_LEVEL_COLORS = {
+    "DEBUG": Fore.CYAN,
+    "INFO": Fore.GREEN,
+    "WARNING": Fore.YELLOW,
+    "ERROR": Fore.RED,
+    "CRITICAL": Fore.RED + Style.BRIGHT,
+}
+
+# Final colored strings, keyed by both the upper- and lowercase level name
+_COLORED_LEVELS = {
+    key: f"{color}{level}{Style.RESET_ALL}"
+    for level, color in _LEVEL_COLORS.items()
+    for key in (level, level.lower())
+}
 
-    color_map = {
-        "DEBUG": Fore.CYAN,
-        "INFO": Fore.GREEN,
-        "WARNING": Fore.YELLOW,
-        "ERROR": Fore.RED,
-        "CRITICAL": Fore.RED + Style.BRIGHT,
-    }
 
-    if level in color_map:
-        event_dict["level"] = f"{color_map[level]}{level}{Style.RESET_ALL}"
+def add_color_to_level(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Add color to log level in development mode."""
+    level = str(event_dict.get("level", ""))
+    colored = _COLORED_LEVELS.get(level)
+    if colored is None and level:
+        # Mixed-case names are rare; normalize only on a table miss
+        colored = _COLORED_LEVELS.get(level.upper())
+    if colored is not None:
+        event_dict["level"] = colored
 
     return event_dict
 
@@ -37,8 +56,7 @@ def setup_logging() -> None:
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
 
-    # Determine log level
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    log_level = _LOG_LEVEL
 
     # Configure standard library logging
     logging.basicConfig(
@@ -48,9 +66,8 @@ def setup_logging() -> None:
     )
 
     # Disable SQLAlchemy verbose logging (keep only warnings and errors)
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.dialects").setLevel(logging.WARNING)
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
     # Processors common to both dev and prod
     common_processors = [
@@ -58,8 +75,11 @@ def setup_logging() -> None:
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
+    # stack_info=True is only passed while debugging; skip the extra
+    # processor call on every event otherwise
+    if log_level <= logging.DEBUG:
+        common_processors.append(structlog.processors.StackInfoRenderer())
 
     if settings.is_production:
         # Production: JSON logs for parsing (PM2, CloudWatch, etc.)
@@ -75,22 +95,22 @@ def setup_logging() -> None:
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
-    # Filter out DEBUG logs in production
-    if settings.is_production:
-        processors.insert(0, structlog.stdlib.filter_by_level)
-
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below log_level are no-ops before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+@lru_cache(maxsize=256)
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """Get a configured logger instance.
 
+    Memoized per name, so repeated calls return the same logger.
+
     Args:
         name: Logger name (usually __name__)
 
@@ -102,7 +122,7 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
         >>> logger.info("user_registered", user_id=12345, username="john")
         >>> logger.error("database_error", error=str(e), query=query)
     """
-    return structlog.get_logger(name)
+    return cast(structlog.typing.FilteringBoundLogger, structlog.get_logger(name))
 
 
 # Initialize logging on module import